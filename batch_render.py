@@ -0,0 +1,108 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from event_records import build_records
+import template_14_day
+import template_3_day
+import template_confirmation
+import template_day_before
+import template_event_display
+
+# Below this many events, process start-up costs more than it saves. Spawning the workers takes about
+# 1.7s and serial rendering about 0.2ms per event for all five templates (benchmarks/run.py render_serial
+# and render_parallel), so 2 workers only break even around 15,000 events and 4 workers around 10,000
+PARALLEL_MIN_EVENTS = 15_000
+
+# Workers are started fresh rather than forked: forking Streamlit's multi-threaded script runner can deadlock them
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+# Template key -> template module. The key doubles as the output filename suffix.
+TEMPLATES = {
+    "event_display": template_event_display,
+    "registration_confirmation": template_confirmation,
+    "14_day_reminder": template_14_day,
+    "3_day_reminder": template_3_day,
+    "day_before_reminder": template_day_before,
+}
+
+# Template key -> human-readable name
+TEMPLATE_LABELS = {
+    "event_display": "📄 Event Display Page",
+    "registration_confirmation": "📧 Registration Confirmation Email",
+    "14_day_reminder": "📧 14-Day Reminder Email",
+    "3_day_reminder": "📧 3-Day Reminder Email",
+    "day_before_reminder": "📧 Day Before Reminder Email",
+}
+
+
+def render_records(records, template):
+    """Render one template for a list of EventRecords, in order."""
+    return list(map(TEMPLATES[template].render, records))
+
+
+def render_batch(df, template):
+    """Render one template for every row of df, in row order."""
+    return render_records(build_records(df), template)
+
+
+def _render_chunk(records, templates):
+    """Worker entry point: render every template for one chunk of records."""
+    return {template: render_records(records, template) for template in templates}
+
+
+def _iter_chunks(records, templates, workers, chunk_size, min_events):
+    """Yield (chunk of records, {template: [html, ...]}) in record order."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(records) < min_events:
+        for record in records:
+            chunk = (record,)
+            yield chunk, _render_chunk(chunk, templates)
+        return
+
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(records) // (workers * 4)))
+    chunks = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_MP_CONTEXT) as executor:
+        # map() yields results in submission order, so output order is deterministic
+        yield from zip(chunks, executor.map(_render_chunk, chunks, repeat(templates)))
+
+
+def render_many(records, templates, workers=1, chunk_size=None, min_events=PARALLEL_MIN_EVENTS):
+    """Render several templates for a list of EventRecords.
+
+    Returns {template: [html, ...]} in record order. With workers > 1 and at least
+    min_events records, chunks of records are rendered in a process pool; smaller
+    inputs are rendered serially. workers=None uses every available core.
+    """
+    rendered = {template: [] for template in templates}
+    for _, chunk_result in _iter_chunks(records, templates, workers, chunk_size, min_events):
+        for template, pages in chunk_result.items():
+            rendered[template].extend(pages)
+    return rendered
+
+
+def iter_rendered(records, templates, workers=1, chunk_size=None, min_events=PARALLEL_MIN_EVENTS):
+    """Yield (position, template, html) for each record and template, in record order.
+
+    Same options as render_many, but only one chunk of pages is held in memory.
+    """
+    position = 0
+    for chunk, chunk_result in _iter_chunks(records, templates, workers, chunk_size, min_events):
+        for offset in range(len(chunk)):
+            for template in templates:
+                yield position + offset, template, chunk_result[template][offset]
+        position += len(chunk)
+
+
+def safe_park_filename(park_name):
+    """Clean up a park name for use in a filename."""
+    safe_park_name = "".join(c for c in park_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    return safe_park_name.replace(' ', '_')
+
+
+def template_filename(park_name, template, row_id):
+    """Filename for one rendered template of one event; the row ID keeps events at the same park apart."""
+    return f"{safe_park_filename(park_name)}_{row_id}_{template}.html"
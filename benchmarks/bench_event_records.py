@@ -0,0 +1,44 @@
+"""Compare per-row safe_get field lookups with the vectorized build_records pass.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_event_records --rows 10000
+"""
+import argparse
+import time
+
+from benchmarks.synthetic import synthetic_events
+from column_schema import apply_schema
+from event_records import EventRecord, build_records
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = apply_schema(synthetic_events(args.rows))
+
+    per_row = best_of(args.repeat, lambda: [EventRecord.from_event(df.iloc[i]) for i in range(len(df))])
+    vectorized = best_of(args.repeat, lambda: build_records(df))
+
+    assert build_records(df) == [EventRecord.from_event(df.iloc[i]) for i in range(len(df))]
+
+    print(f"rows:              {args.rows}")
+    print(f"per-row safe_get:  {per_row:.3f}s")
+    print(f"build_records:     {vectorized:.3f}s")
+    print(f"speedup:           {per_row / vectorized:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
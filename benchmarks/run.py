@@ -0,0 +1,171 @@
+"""Benchmark suite for parsing, cleanup, template rendering and ZIP packaging.
+
+Run from the repository root:
+
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 60,1000,10000,100000 --repeat 1
+    python -m benchmarks.run --only parse,zip --compare benchmarks/results/previous.json
+
+Results are written as JSON (default: benchmarks/results/bench_<timestamp>.json)
+so runs can be compared over time.
+"""
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from batch_render import TEMPLATES, iter_rendered, render_many, render_records, template_filename
+from benchmarks.synthetic import synthetic_csv
+from cleanup import TEXT_COLUMNS, clean_text_columns, format_phone_numbers
+from data_loading import read_events_csv
+from event_records import build_records
+from park_locations import ParkResolver, fill_park_zips, load_park_locations
+from sheet_export import EXPORT_FORMATS, export_sheet
+from sheet_merge import merge_upload
+from validation import validate
+from zip_export import write_zip
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+DEFAULT_SIZES = [60, 1000, 10000]
+
+def app_clean_phone_apply(df):
+    """The "🔧 Auto-format Phone Numbers" button before it was vectorized: the baseline for cleanup.format_phone_numbers."""
+    def clean_phone(phone):
+        if pd.isna(phone):
+            return phone
+        digits = ''.join(filter(str.isdigit, str(phone)))
+        if len(digits) == 10:
+            return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+        elif len(digits) == 11 and digits.startswith('1'):
+            digits = digits[1:]
+            return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+        else:
+            return phone
+
+    df["coordinator_phone"] = df["coordinator_phone"].apply(clean_phone)
+
+
+def clean_phone_vectorized(df):
+    df["coordinator_phone"], _ = format_phone_numbers(df["coordinator_phone"])
+
+
+def app_clean_text(df):
+    """The "🧹 Clean Text Fields" button before it was vectorized: the baseline for cleanup.clean_text_columns."""
+    for col in TEXT_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(str).str.strip()
+            df[col] = df[col].str.replace('  ', ' ')
+            df[col] = df[col].replace('nan', '')
+
+
+def _package_zip(records):
+    files = (
+        (template_filename(records[position].park_name, template, position + 1), html_content)
+        for position, template, html_content in iter_rendered(records, list(TEMPLATES))
+    )
+    with tempfile.TemporaryFile() as f:
+        write_zip(files, f)
+
+
+def benchmarks_for(data):
+    """Name -> (setup, timed function). setup() builds fresh input for each repeat."""
+    df = read_events_csv(data)
+    records = build_records(df)
+
+    suite = {
+        "parse": (lambda: data, read_events_csv),
+        "cleanup_phone": (df.copy, app_clean_phone_apply),
+        "cleanup_phone_vectorized": (df.copy, clean_phone_vectorized),
+        "cleanup_text": (df.copy, app_clean_text),
+        "cleanup_text_vectorized": (df.copy, clean_text_columns),
+        "fill_zips": (df.copy, fill_park_zips),
+        "resolve_parks": (lambda: df["park_name"], lambda names: ParkResolver(load_park_locations()).resolve(names)),
+        "merge_upload": (lambda: (df, df.copy(), df), lambda frames: merge_upload(*frames)),
+        "validate": (lambda: df, validate),
+        "build_records": (lambda: df, build_records),
+        "zip": (lambda: None, lambda _: _package_zip(records)),
+        # All templates in this process, and in worker processes whatever the size, to place PARALLEL_MIN_EVENTS
+        "render_serial": (lambda: records, lambda recs: render_many(recs, list(TEMPLATES))),
+        "render_parallel": (
+            lambda: records,
+            lambda recs: render_many(recs, list(TEMPLATES), workers=max(2, os.cpu_count() or 1), min_events=0),
+        ),
+    }
+    for fmt in EXPORT_FORMATS:
+        suite[f"export_{fmt}"] = (lambda: df, lambda frame, f=fmt: export_sheet(frame, f))
+    for template in TEMPLATES:
+        suite[f"render_{template}"] = (lambda: records, lambda recs, t=template: render_records(recs, t))
+    return suite
+
+
+def time_benchmark(setup, func, repeat):
+    timings = []
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        func(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(sizes, repeat, only=None):
+    results = []
+    for rows in sizes:
+        data = synthetic_csv(rows)
+        for name, (setup, func) in benchmarks_for(data).items():
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+            seconds = time_benchmark(setup, func, repeat)
+            results.append({"benchmark": name, "rows": rows, "seconds": seconds})
+            print(f"{name:<36} {rows:>7} rows  {seconds * 1000:>10.2f} ms")
+    return results
+
+
+def compare(results, previous_path):
+    with open(previous_path) as f:
+        previous = {(r["benchmark"], r["rows"]): r["seconds"] for r in json.load(f)["results"]}
+    print(f"\nCompared with {previous_path}:")
+    for result in results:
+        before = previous.get((result["benchmark"], result["rows"]))
+        if before:
+            print(f"{result['benchmark']:<36} {result['rows']:>7} rows  {before / result['seconds']:>6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated row counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of this many runs per benchmark")
+    parser.add_argument("--only", help="Comma-separated benchmark name prefixes, e.g. parse,render")
+    parser.add_argument("--output", help="JSON results path")
+    parser.add_argument("--compare", help="Previous JSON results to compare against")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    only = args.only.split(",") if args.only else None
+    results = run(sizes, args.repeat, only)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "results": results,
+        }, f, indent=2)
+    print(f"\nSaved results to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
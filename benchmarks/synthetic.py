@@ -0,0 +1,113 @@
+"""Synthetic YSPD event sheets shaped like the Google Form export."""
+import random
+
+import numpy as np
+import pandas as pd
+
+PARK_NAMES = [
+    "A.H. Stephens State Park", "Amicalola Falls State Park", "Black Rock Mountain State Park",
+    "Chattahoochee Bend State Park", "Chief Vann House Historic Site", "Cloudland Canyon State Park",
+    "Crooked River State Park", "Dahlonega Gold Museum Historic Site", "Don Carter State Park",
+    "Elijah Clark State Park", "Etowah Indian Mounds Historic Site", "F.D. Roosevelt State Park",
+    "Florence Marina State Park", "Fort King George Historic Site", "Fort McAllister State Park",
+    "Fort Morris Historic Site", "Fort Mountain State Park", "Fort Yargo State Park",
+    "General Coffee State Park", "George L. Smith State Park", "George T. Bagby State Park",
+    "Georgia Veterans State Park", "Hamburg State Park", "Hard Labor Creek State Park",
+    "Hart State Park", "High Falls State Park", "Hofwyl-Broadfield Plantation Historic Site",
+    "Indian Springs State Park", "Jack Hill State Park", "James H. (Sloppy) Floyd State Park",
+    "Jarrell Plantation Historic Site", "Kolomoki Mounds State Park", "Laura S. Walker State Park",
+    "Little Ocmulgee State Park", "Little White House Historic Site", "Magnolia Springs State Park",
+    "Mistletoe State Park", "Moccasin Creek State Park", "New Echota Historic Site",
+    "Panola Mountain State Park", "Pickett's Mill Battlefield Historic Site", "Providence Canyon State Park",
+    "Red Top Mountain State Park", "Reed Bingham State Park", "Richard B. Russell State Park",
+    "Robert Toombs House Historic Site", "Seminole State Park", "Skidaway Island State Park",
+    "Smithgall Woods State Park", "Stephen C. Foster State Park", "Sweetwater Creek State Park",
+    "Tallulah Gorge State Park", "Traveler's Rest Historic Site", "Tugaloo State Park",
+    "Unicoi State Park", "Victoria Bryant State Park", "Vogel State Park",
+    "Watson Mill Bridge State Park", "Wormsloe Historic Site",
+]
+
+FIRST_NAMES = ["Jane", "Bob", "Maria", "DeShawn", "Li", "Priya", "Tom", "Ana", "Chris", "Pat"]
+LAST_NAMES = ["Smith", "Johnson", "Nguyen", "Garcia", "Brown", "Patel", "Williams", "Lee", "Davis", "Moore"]
+EMAIL_DOMAINS = ["gmail.com", "yahoo.com", "dnr.ga.gov", "outlook.com", "gmial.com", "aol.com"]
+PHONE_FORMATS = [
+    "({a}) {b}-{c}", "{a}-{b}-{c}", "{a}.{b}.{c}", "{a}{b}{c}", "+1 {a} {b} {c}", "1-{a}-{b}-{c}", "{b}-{c}",
+]
+MEETING_LOCATIONS = [
+    "Visitor Center", "Group Shelter 1", "Park Office", "Boat Ramp Parking Lot", "Trailhead kiosk",
+    "Pioneer Campground", "Museum entrance",
+]
+MEETING_TIMES = ["8:00 AM", "8:30 AM", "9:00 AM", "9 AM", "9:30 am", "10:00 AM"]
+END_TIMES = ["12:00 PM", "Noon", "1:00 PM", "2 PM", "3:00 PM"]
+BRING_ITEMS = ["gloves", "sun screen", "bug spray", "water bottle", "hat", "loppers", "closed-toe shoes", "snacks"]
+REFRESHMENTS = ["Water", "Snacks and water", "Lunch will be provided", "No", "Water and lunch"]
+CHILDREN = ["Yes, ages 8 and up", "No", "Scavenger hunt for kids", "Ages 12+"]
+DESCRIPTION_WORDS = (
+    "trail maintenance invasive species removal litter pickup painting picnic shelters planting native "
+    "pollinator garden clearing brush along the lake shore repairing boardwalks mulching beds restoring "
+    "historic fences cleaning campsites building bluebird boxes removing privet and kudzu"
+).split()
+
+TEXT_COLUMNS = {
+    "coordinator": "Volunteer Coordinator Name",
+    "email": "Volunteer Coordinator Email",
+    "phone": "Volunteer Coordinator Phone",
+    "park": "Chapter/Park Name",
+    "project": "Describe the project(s) that are planned at your site.",
+    "location": "Specific meeting location - e.g., Visitor Center, Group Shelter 1.",
+    "meeting_time": "Meeting Time",
+    "end_time": "What time will the activities end?",
+    "bring": "What Should A Volunteer Bring for the Day? e.g., gloves, sun screen, bug spray, etc.",
+    "instructions": "Special Instructions: e.g., closed-toe shoes, working near water, bring a change of clothes if desired, etc.",
+    "refreshments": "Will snacks, lunch, water, be provided?",
+    "children": "Will you have activities for children? Age limit?",
+    "zip": "Park Zip Code",
+}
+
+
+def _maybe(rng, value, missing_rate):
+    return np.nan if rng.random() < missing_rate else value
+
+
+def _pad(rng, value):
+    # Form answers often carry stray and doubled whitespace
+    if rng.random() < 0.2:
+        return f"  {value.replace(' ', '  ', 1)} "
+    return value
+
+
+def _description(rng):
+    words = rng.choices(DESCRIPTION_WORDS, k=rng.randint(20, 120))
+    return " ".join(words).capitalize() + "."
+
+
+def _row(rng, missing_rate):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    area, prefix, line = rng.randint(200, 999), rng.randint(200, 999), rng.randint(0, 9999)
+    phone = rng.choice(PHONE_FORMATS).format(a=area, b=prefix, c=f"{line:04d}")
+    return {
+        TEXT_COLUMNS["coordinator"]: _maybe(rng, _pad(rng, f"{first} {last}"), missing_rate),
+        TEXT_COLUMNS["email"]: _maybe(rng, f"{first}.{last}@{rng.choice(EMAIL_DOMAINS)}".lower(), missing_rate),
+        TEXT_COLUMNS["phone"]: _maybe(rng, phone, missing_rate),
+        TEXT_COLUMNS["park"]: _pad(rng, rng.choice(PARK_NAMES)),
+        TEXT_COLUMNS["project"]: _maybe(rng, _description(rng), missing_rate),
+        TEXT_COLUMNS["location"]: _maybe(rng, _pad(rng, rng.choice(MEETING_LOCATIONS)), missing_rate),
+        TEXT_COLUMNS["meeting_time"]: _maybe(rng, rng.choice(MEETING_TIMES), missing_rate),
+        TEXT_COLUMNS["end_time"]: _maybe(rng, rng.choice(END_TIMES), missing_rate),
+        TEXT_COLUMNS["bring"]: _maybe(rng, ", ".join(rng.sample(BRING_ITEMS, rng.randint(1, 5))), missing_rate),
+        TEXT_COLUMNS["instructions"]: _maybe(rng, "Closed-toe shoes required; working near water.", missing_rate * 3),
+        TEXT_COLUMNS["refreshments"]: _maybe(rng, rng.choice(REFRESHMENTS), missing_rate * 2),
+        TEXT_COLUMNS["children"]: _maybe(rng, rng.choice(CHILDREN), missing_rate * 3),
+        TEXT_COLUMNS["zip"]: _maybe(rng, f"3{rng.randint(0, 1999):04d}", missing_rate * 4),
+    }
+
+
+def synthetic_events(rows, seed=0, missing_rate=0.05):
+    """A DataFrame of `rows` events with the form's long column names, NaNs and messy values."""
+    rng = random.Random(seed)
+    return pd.DataFrame([_row(rng, missing_rate) for _ in range(rows)], columns=list(TEXT_COLUMNS.values()))
+
+
+def synthetic_csv(rows, seed=0, missing_rate=0.05):
+    """The same sheet serialized as CSV bytes, as it arrives from the uploader."""
+    return synthetic_events(rows, seed, missing_rate).to_csv(index=False).encode("utf-8")
@@ -0,0 +1,64 @@
+import pandas as pd
+
+# Ten digits, optionally preceded by a US country code of 1
+_PHONE_DIGITS = r"^1?(\d{3})(\d{3})(\d{4})$"
+
+
+def format_phone_numbers(phones):
+    """Format a column of phone numbers as (XXX) XXX-XXXX in one vectorized pass.
+
+    Non-digits are stripped and a leading country code of 1 is dropped. Missing
+    values stay missing and anything that is not 10 digits afterwards is left
+    unchanged. Returns (formatted, unformatted), where unformatted holds the
+    original non-blank values that could not be formatted.
+    """
+    missing = phones.isna()
+    digits = phones.astype(str).str.replace(r"\D", "", regex=True)
+    matched = digits.str.fullmatch(_PHONE_DIGITS).fillna(False).astype(bool) & ~missing
+
+    formatted = digits.str.replace(_PHONE_DIGITS, r"(\1) \2-\3", regex=True)
+    result = phones.where(~matched, formatted)
+
+    blank = missing | (phones.astype(str).str.strip() == "")
+    return result, phones[~matched & ~blank]
+
+
+# Free-text columns tidied by the "🧹 Clean Text Fields" button
+TEXT_COLUMNS = [
+    "coordinator_name",
+    "park_name",
+    "project_description",
+    "meeting_location",
+]
+
+# Leading/trailing whitespace, runs of two or more, or tabs and newlines
+_MESSY_WHITESPACE = r"^\s|\s$|\s\s|[^\S ]"
+
+
+def clean_text_columns(df, columns=TEXT_COLUMNS):
+    """Strip and collapse every whitespace run to one space, in place, for the given columns.
+
+    Each column is scanned once with a single regex and only the values that
+    need fixing are rewritten. Missing values stay missing rather than becoming
+    the string 'nan'. Returns the number of values changed.
+    """
+    changed = 0
+    for column in columns:
+        if column not in df.columns:
+            continue
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Clean each distinct answer once and re-encode
+            categories = values.cat.categories
+            cleaned = categories.str.replace(r"\s+", " ", regex=True).str.strip()
+            if (cleaned != categories).any():
+                changed += int(values.isin(categories[cleaned != categories]).sum())
+                df[column] = values.map(dict(zip(categories, cleaned))).astype("category")
+            continue
+        if values.dtype != object and not pd.api.types.is_string_dtype(values):
+            continue
+        messy = values.str.contains(_MESSY_WHITESPACE, regex=True, na=False).astype(bool)
+        if messy.any():
+            df.loc[messy, column] = values[messy].str.replace(r"\s+", " ", regex=True).str.strip()
+            changed += int(messy.sum())
+    return changed
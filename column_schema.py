@@ -0,0 +1,119 @@
+"""Event spreadsheet schema: short field names for the Google Form's long column headers.
+
+The form export's headers are whole questions ("Specific meeting location -
+e.g., Visitor Center, Group Shelter 1.") that drift between form versions.
+Each field lists the headers it is known by, matched after normalize_header()
+drops case, punctuation and the "e.g." examples. The loader renames columns to
+field names once per upload, so the rest of the code only uses the short names.
+"""
+import re
+from collections import namedtuple
+
+Field = namedtuple("Field", ["label", "header", "aliases"])
+
+# Field name -> Field(short label for display, header in the form export, other headers seen for it)
+FIELDS = {
+    "coordinator_name": Field(
+        "Coordinator Name", "Volunteer Coordinator Name", ["Coordinator"]
+    ),
+    "coordinator_email": Field(
+        "Coordinator Email", "Volunteer Coordinator Email", ["Email", "Email Address"]
+    ),
+    "coordinator_phone": Field(
+        "Coordinator Phone", "Volunteer Coordinator Phone", ["Phone", "Phone Number"]
+    ),
+    "park_name": Field(
+        "Park Name", "Chapter/Park Name", ["Park", "Chapter Name", "Site Name"]
+    ),
+    "project_description": Field(
+        "Project Description",
+        "Describe the project(s) that are planned at your site.",
+        ["Project", "Describe the projects planned at your site"],
+    ),
+    "meeting_location": Field(
+        "Meeting Location",
+        "Specific meeting location - e.g., Visitor Center, Group Shelter 1.",
+        ["Meeting Place"],
+    ),
+    "meeting_time": Field(
+        "Meeting Time", "Meeting Time", ["Start Time", "What time will the activities start?"]
+    ),
+    "end_time": Field(
+        "End Time", "What time will the activities end?", ["Activities End"]
+    ),
+    "what_to_bring": Field(
+        "What to Bring",
+        "What Should A Volunteer Bring for the Day? e.g., gloves, sun screen, bug spray, etc.",
+        ["What should volunteers bring?"],
+    ),
+    "special_instructions": Field(
+        "Special Instructions",
+        "Special Instructions: e.g., closed-toe shoes, working near water, bring a change of clothes if desired, etc.",
+        [],
+    ),
+    "refreshments": Field(
+        "Refreshments", "Will snacks, lunch, water, be provided?", ["Will snacks, lunch, or water be provided?"]
+    ),
+    "children_activities": Field(
+        "Children's Activities",
+        "Will you have activities for children? Age limit?",
+        ["Activities for children"],
+    ),
+    "park_zip": Field(
+        "Park Zip Code", "Park Zip Code", ["Zip Code", "Zip"]
+    ),
+}
+
+# Example answers in a question ("e.g., ...") are reworded freely, so they are not part of the match
+_EXAMPLES = re.compile(r"\be\.g\..*", re.DOTALL)
+
+
+def normalize_header(header):
+    """Lowercase words of a header with punctuation and any "e.g." examples removed."""
+    text = _EXAMPLES.sub("", str(header).lower())
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+def _header_lookup(aliases):
+    # Normalized header -> field name, built once; either the field name, label and form header, or the aliases
+    lookup = {}
+    for name, field in FIELDS.items():
+        for header in field.aliases if aliases else [name, field.label, field.header]:
+            lookup.setdefault(normalize_header(header), name)
+    return lookup
+
+
+_HEADER_LOOKUP = _header_lookup(aliases=False)
+_ALIAS_LOOKUP = _header_lookup(aliases=True)
+
+
+def resolve_headers(headers):
+    """Dict of header -> field name for every header that matches a field; the first header for a field wins.
+
+    Aliases only count for fields no header names exactly, so a generic
+    "Email Address" column (the form's respondent email) cannot take the
+    place of a "Volunteer Coordinator Email" column later in the sheet.
+    """
+    resolved = {}
+    for lookup in (_HEADER_LOOKUP, _ALIAS_LOOKUP):
+        for header in headers:
+            name = lookup.get(normalize_header(header))
+            if name is not None and header not in resolved and name not in resolved.values():
+                resolved[header] = name
+    # Keep the sheet's column order
+    return {header: resolved[header] for header in headers if header in resolved}
+
+
+def apply_schema(df):
+    """df with recognized headers renamed to field names; other columns keep their header."""
+    return df.rename(columns=resolve_headers(df.columns))
+
+
+def form_headers(df):
+    """df with field names renamed back to the form export's headers, e.g. for a CSV download."""
+    return df.rename(columns={name: field.header for name, field in FIELDS.items()})
+
+
+def column_labels(columns):
+    """Dict of field name -> short display label for the fields among columns (for st column_config)."""
+    return {name: FIELDS[name].label for name in columns if name in FIELDS}
@@ -0,0 +1,64 @@
+import hashlib
+import io
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from column_schema import resolve_headers
+
+# Answers that repeat across events are stored as categoricals
+CATEGORY_COLUMNS = ["park_name", "meeting_time", "end_time", "refreshments", "children_activities"]
+
+# Every other column holds free text, kept as pyarrow-backed strings with NaN for blanks
+TEXT_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+
+# Name of the index that identifies each event. Row IDs are numbered from 1 on upload and never reused,
+# so they stay attached to the same event through edits, deletions and merges
+ROW_ID = "row_id"
+
+
+def content_hash(data):
+    """Stable hash of an uploaded file's bytes, used as the parse cache key."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _keep_column(column):
+    # Trailing commas in form exports show up as empty "Unnamed: N" columns
+    return not column.startswith("Unnamed:")
+
+
+def read_events_csv(data):
+    """Parse the event spreadsheet from raw CSV bytes.
+
+    Every column is read as text so ZIP codes and phone numbers keep their
+    original digits (no 30102.0 floats); blank cells stay NaN. Headers are
+    resolved once against the column schema and renamed to field names;
+    fields in CATEGORY_COLUMNS are stored as categoricals, each distinct
+    answer once. Rows are indexed by ROW_ID, numbered from 1.
+    """
+    fields = resolve_headers(pd.read_csv(io.BytesIO(data), nrows=0, usecols=_keep_column).columns)
+    dtypes = defaultdict(
+        lambda: TEXT_DTYPE, {header: "category" for header, name in fields.items() if name in CATEGORY_COLUMNS}
+    )
+    df = pd.read_csv(io.BytesIO(data), dtype=dtypes, usecols=_keep_column).rename(columns=fields)
+    df.index = pd.RangeIndex(1, len(df) + 1, name=ROW_ID)
+    return df
+
+
+def decode_categories(df):
+    """Shallow copy of df with categorical columns as plain strings, for code that writes new values into them."""
+    categorical = [column for column in df.columns if isinstance(df[column].dtype, pd.CategoricalDtype)]
+    if not categorical:
+        return df.copy(deep=False)
+    return df.astype(dict.fromkeys(categorical, TEXT_DTYPE))
+
+
+def memory_report(df):
+    """Per-column dtype, distinct values and memory in MB, next to the same data held as Python object strings."""
+    return pd.DataFrame({
+        "dtype": df.dtypes.astype(str),
+        "distinct": df.nunique(),
+        "MB": df.memory_usage(index=False, deep=True) / 2**20,
+        "MB as object": df.astype(object).memory_usage(index=False, deep=True) / 2**20,
+    })
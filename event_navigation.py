@@ -0,0 +1,41 @@
+"""Navigation index for the Single Event Editor.
+
+Building a label per event is a pass over the whole sheet, so it is done
+once per sheet version (see EventSheet.event_index) rather than on every
+rerun. Searching then only scans the distinct park names.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# labels: one "3. Oak Park" label per row position, numbered by row ID; parks: park name -> row positions,
+# in sheet order; row_ids: the row ID at each position
+EventIndex = namedtuple("EventIndex", ["labels", "parks", "row_ids"])
+
+
+def index_events(df):
+    """The EventIndex of df."""
+    park_names = df["park_name"].astype(object)
+    row_ids = df.index.to_numpy()
+    labels = [f"{row_id}. {name}" for row_id, name in zip(row_ids.tolist(), park_names.tolist())]
+
+    # Group row positions by park with one sort; events without a park (code -1) sort first and are skipped
+    codes, parks = pd.factorize(park_names)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(parks) + 1))
+    return EventIndex(labels, {park: order[bounds[i]:bounds[i + 1]] for i, park in enumerate(parks)}, row_ids)
+
+
+def search_events(index, query):
+    """Row positions of the events whose park name contains query, ignoring case, or whose row ID is query.
+
+    A blank query matches every event.
+    """
+    query = query.strip().lower()
+    if not query:
+        return np.arange(len(index.labels))
+    matches = [positions for park, positions in index.parks.items() if query in str(park).lower()]
+    if query.isdigit():
+        matches.append(np.flatnonzero(index.row_ids == int(query)))
+    return np.unique(np.concatenate(matches)) if matches else np.array([], dtype=int)
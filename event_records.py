@@ -0,0 +1,64 @@
+from collections import namedtuple
+from functools import lru_cache
+
+from column_schema import resolve_headers
+from utils import safe_get
+
+# Every field the templates read (a column_schema field name) -> default when missing
+EVENT_FIELDS = {
+    "park_name": "",
+    "coordinator_name": "",
+    "coordinator_email": "",
+    "coordinator_phone": "",
+    "project_description": "",
+    "meeting_location": "",
+    "meeting_time": "",
+    "end_time": "End of day",
+    "what_to_bring": "",
+    "special_instructions": "",
+    "refreshments": "",
+    "children_activities": "",
+    "park_zip": "",
+}
+
+
+@lru_cache(maxsize=None)
+def _event_keys(keys):
+    # Field name -> the key a row uses for it, resolved once per distinct set of keys; unmatched fields map to themselves
+    return {**{field: field for field in EVENT_FIELDS}, **{name: key for key, name in resolve_headers(keys).items()}}
+
+
+class EventRecord(namedtuple("EventRecord", EVENT_FIELDS)):
+    """One event's template fields as clean, stripped strings."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_event(cls, event):
+        """Build a record from a single row (Series or dict) using safe_get.
+
+        The row may be keyed by field names or by the form export's headers.
+        """
+        keys = _event_keys(tuple(event.keys()))
+        return cls._make(safe_get(event, keys[field], default) for field, default in EVENT_FIELDS.items())
+
+
+def normalize_column(df, column, default=""):
+    """Return a column as a list of stripped strings, with NaN/None replaced by default.
+
+    Vectorized equivalent of calling utils.safe_get on every row.
+    """
+    if column not in df.columns:
+        return [default] * len(df)
+    values = df[column]
+    missing = values.isna()
+    cleaned = values.astype(object).astype(str).str.strip()
+    if missing.any():
+        cleaned = cleaned.where(~missing, default)
+    return cleaned.tolist()
+
+
+def build_records(df):
+    """Normalize every template field of df in one pass and return one EventRecord per row."""
+    columns = [normalize_column(df, field, default) for field, default in EVENT_FIELDS.items()]
+    return list(map(EventRecord._make, zip(*columns)))
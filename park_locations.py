@@ -0,0 +1,170 @@
+"""Offline Georgia state park directory: park name -> canonical park, ZIP code and coordinates.
+
+The directory is bundled as park_locations.csv, read once and held in memory.
+Rows that share a park_id are alternate names for the same park; the first
+row for each park_id holds its official name.
+"""
+import csv
+import os
+import re
+from collections import Counter, defaultdict, namedtuple
+from functools import lru_cache
+
+import pandas as pd
+
+PARK_LOCATIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "park_locations.csv")
+
+# Matches scoring below MIN_SCORE are dropped; below CONFIDENT_SCORE they go on the review list
+MIN_SCORE = 0.4
+CONFIDENT_SCORE = 0.8
+
+# Score for a partial name whose words all belong to exactly one park, e.g. "Cloudland"
+WORD_MATCH_SCORE = 0.9
+
+# Words every park name shares, and shorthand seen in sheets
+GENERIC_WORDS = {"state", "park", "parks", "historic", "site", "sp", "shs", "hs", "the"}
+ABBREVIATIONS = {"mtn": "mountain", "mt": "mountain", "ft": "fort"}
+
+ParkLocation = namedtuple("ParkLocation", ["park_id", "name", "zip", "latitude", "longitude"])
+
+
+@lru_cache(maxsize=None)
+def load_park_locations(path=PARK_LOCATIONS_PATH):
+    """Every row of the bundled directory as a tuple of ParkLocation, read on first use."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return tuple(
+            ParkLocation(row["park_id"], row["name"], row["zip"], float(row["latitude"]), float(row["longitude"]))
+            for row in csv.DictReader(f)
+        )
+
+
+@lru_cache(maxsize=None)
+def park_directory(path=PARK_LOCATIONS_PATH):
+    """Dict of park_id -> ParkLocation under the park's official name."""
+    directory = {}
+    for location in load_park_locations(path):
+        directory.setdefault(location.park_id, location)
+    return directory
+
+
+def park_key(name):
+    """The distinctive part of a park name: lowercase, punctuation and generic words dropped."""
+    words = re.sub(r"[^a-z0-9]+", " ", str(name).lower()).split()
+    return " ".join(ABBREVIATIONS.get(word, word) for word in words if word not in GENERIC_WORDS)
+
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ParkResolver:
+    """Map free-text park names to canonical park IDs using a trigram index over the directory.
+
+    Exact matches on the distinctive part of the name score 1.0, and names whose
+    words all belong to a single park score WORD_MATCH_SCORE. Anything else is
+    scored by trigram overlap (Dice coefficient) against the best candidate.
+    Results are memoized per distinct name.
+    """
+
+    def __init__(self, locations):
+        self._exact = {}
+        self._words = defaultdict(set)
+        self._entries = []
+        self._index = defaultdict(list)
+        for location in locations:
+            key = park_key(location.name)
+            self._exact.setdefault(key, location.park_id)
+            for word in key.split():
+                self._words[word].add(location.park_id)
+            trigrams = _trigrams(key)
+            for trigram in trigrams:
+                self._index[trigram].append(len(self._entries))
+            self._entries.append((location.park_id, len(trigrams)))
+        self._memo = {}
+
+    def match(self, name):
+        """(park_id, score) for one name; (None, 0.0) when nothing scores MIN_SCORE."""
+        if name in self._memo:
+            return self._memo[name]
+
+        key = park_key(name) if isinstance(name, str) else ""
+        words = key.split()
+        word_parks = set.intersection(*(self._words.get(word, set()) for word in words)) if words else set()
+        if key in self._exact:
+            result = (self._exact[key], 1.0)
+        elif len(word_parks) == 1:
+            result = (word_parks.pop(), WORD_MATCH_SCORE)
+        else:
+            trigrams = _trigrams(key)
+            shared = Counter(entry for trigram in trigrams for entry in self._index.get(trigram, ()))
+            result = (None, 0.0)
+            for entry, count in shared.items():
+                park_id, size = self._entries[entry]
+                score = round(2 * count / (len(trigrams) + size), 3)
+                if score >= MIN_SCORE and score > result[1]:
+                    result = (park_id, score)
+
+        self._memo[name] = result
+        return result
+
+    def resolve(self, park_names):
+        """DataFrame of park_id, park_name (official) and score for each row of a Series of names."""
+        # Plain objects, so results never inherit a categorical dtype from the names
+        park_names = park_names.astype(object)
+        matches = {name: self.match(name) for name in park_names.drop_duplicates()}
+        directory = park_directory()
+        return pd.DataFrame({
+            "park_id": park_names.map({name: park_id for name, (park_id, _) in matches.items() if park_id}),
+            "park_name": park_names.map(
+                {name: directory[park_id].name for name, (park_id, _) in matches.items() if park_id}
+            ),
+            "score": park_names.map({name: score for name, (_, score) in matches.items()}).astype(float),
+        }, index=park_names.index)
+
+
+@lru_cache(maxsize=None)
+def default_resolver():
+    return ParkResolver(load_park_locations())
+
+
+def resolve_parks(park_names):
+    """Resolve a Series of park names against the bundled directory (see ParkResolver.resolve)."""
+    return default_resolver().resolve(park_names)
+
+
+def canonical_park_names(park_names, min_score=CONFIDENT_SCORE):
+    """Official name where a park name resolves confidently, otherwise the name as typed, stripped."""
+    resolved = resolve_parks(park_names)
+    confident = resolved["score"] >= min_score
+    return resolved["park_name"].where(confident, park_names.str.strip())
+
+
+def park_review_list(park_names, min_score=CONFIDENT_SCORE):
+    """One row per distinct park name that did not resolve confidently, with its best match and row count."""
+    resolved = resolve_parks(park_names)
+    review = resolved[resolved["score"] < min_score].assign(name=park_names)
+    return (
+        review.groupby("name", dropna=False)
+        .agg(best_match=("park_name", "first"), score=("score", "first"), rows=("score", "size"))
+        .reset_index()
+        .sort_values(["score", "rows"], ascending=[True, False], ignore_index=True)
+    )
+
+
+def lookup_park_zips(park_names, min_score=CONFIDENT_SCORE):
+    """ZIP code for each park name in a Series, NaN where the park does not resolve confidently."""
+    resolved = resolve_parks(park_names)
+    zips = {park_id: location.zip for park_id, location in park_directory().items()}
+    return resolved["park_id"].where(resolved["score"] >= min_score).map(zips)
+
+
+def fill_park_zips(df, park_column="park_name", zip_column="park_zip"):
+    """Fill blank ZIP codes in place for every park found in the directory. Returns the number filled."""
+    zips = df[zip_column]
+    missing = zips.isna() | (zips.astype(str).str.strip() == "")
+    found = lookup_park_zips(df.loc[missing, park_column])
+    fill = missing.copy()
+    fill[missing] = found.notna().to_numpy()
+    df.loc[fill, zip_column] = found.dropna().to_numpy()
+    return int(fill.sum())
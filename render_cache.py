@@ -0,0 +1,99 @@
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+
+from batch_render import PARALLEL_MIN_EVENTS, TEMPLATES, iter_rendered
+
+# ~15 KB per page, so the default bound is roughly 30 MB of HTML
+DEFAULT_MAX_ENTRIES = 2000
+
+
+@lru_cache(maxsize=None)
+def template_version(template):
+    """Hash of a template module's source; editing the template invalidates its entries."""
+    with open(TEMPLATES[template].__file__, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+
+
+def render_key(template, record):
+    """Cache key from the template, its source hash and the record fields it reads."""
+    digest = hashlib.blake2b(digest_size=16)
+    for field in TEMPLATES[template].FIELDS:
+        digest.update(getattr(record, field).encode('utf-8'))
+        digest.update(b'\x1f')
+    return template, template_version(template), digest.hexdigest()
+
+
+class RenderCache:
+    """Bounded LRU cache of rendered pages, keyed by render_key."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get(self, key):
+        html_content = self._entries.get(key)
+        if html_content is not None:
+            self._entries.move_to_end(key)
+        return html_content
+
+    def _put(self, key, html_content):
+        self._entries[key] = html_content
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def render(self, template, record):
+        """Render one template for one record, reusing a cached page when the fields are unchanged."""
+        key = render_key(template, record)
+        html_content = self._get(key)
+        if html_content is None:
+            self.misses += 1
+            html_content = TEMPLATES[template].render(record)
+            self._put(key, html_content)
+        else:
+            self.hits += 1
+        return html_content
+
+    def iter_rendered(self, records, templates, workers=1, chunk_size=None, min_events=PARALLEL_MIN_EVENTS, store=True):
+        """Like batch_render.iter_rendered, but only records with a cache miss are rendered.
+
+        With store=False cached pages are reused but newly rendered ones are
+        not kept, so a one-off bulk export does not fill the cache.
+        """
+        keys = [[render_key(template, record) for template in templates] for record in records]
+        stale = [position for position, row in enumerate(keys) if any(key not in self._entries for key in row)]
+        fresh = iter_rendered([records[position] for position in stale], templates, workers, chunk_size, min_events)
+        stale = set(stale)
+
+        for position, record in enumerate(records):
+            for template, key in zip(templates, keys[position]):
+                if position in stale:
+                    _, _, html_content = next(fresh)
+                    if key in self._entries:
+                        self.hits += 1
+                    else:
+                        self.misses += 1
+                    if store:
+                        self._put(key, html_content)
+                else:
+                    # May have been evicted while earlier records were added
+                    html_content = self._get(key)
+                    if html_content is None:
+                        self.misses += 1
+                        html_content = TEMPLATES[template].render(record)
+                        if store:
+                            self._put(key, html_content)
+                    else:
+                        self.hits += 1
+                yield position, template, html_content
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,186 @@
+"""Session data model: the uploaded sheet plus a log of cleanup edits.
+
+Instead of holding the upload and a full cleaned copy, a session keeps the
+uploaded frame untouched and records each cleanup step as a sparse Edit: the
+cells it changed, and any rows it added or removed. The cleaned view is
+rebuilt from the log when needed. With pandas copy-on-write, the view only
+owns copies of the columns that were edited, so undo and redo are cheap.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from data_loading import decode_categories
+from event_navigation import index_events
+from sheet_export import export_sheet
+from sheet_merge import same_values
+from validation import validate
+
+Edit = namedtuple("Edit", ["description", "columns", "cells", "dropped_rows", "added_rows"])
+
+
+def diff_frames(before, after, description=""):
+    """The Edit that turns before into after, or None when they hold the same data.
+
+    cells maps each changed column to (row labels, new values); rows present in
+    only one frame are recorded whole as dropped_rows / added_rows.
+    """
+    dropped = before.index.difference(after.index, sort=False)
+    added = after.index.difference(before.index, sort=False)
+    common = after.index.intersection(before.index, sort=False)
+
+    cells = {}
+    for column in after.columns:
+        values = after.loc[common, column]
+        if column in before.columns:
+            changed = ~same_values(before.loc[common, column], values)
+        else:
+            changed = np.ones(len(common), dtype=bool)
+        if changed.any():
+            cells[column] = (common[changed], values[changed].to_numpy())
+
+    columns = list(after.columns)
+    if not cells and dropped.empty and added.empty and columns == list(before.columns):
+        return None
+    return Edit(description, columns, cells, list(dropped), after.loc[added] if len(added) else None)
+
+
+def apply_edit(frame, edit):
+    """A new frame with edit applied; frame itself is left untouched."""
+    frame = frame.drop(index=edit.dropped_rows) if edit.dropped_rows else frame.copy(deep=False)
+    for column, (labels, values) in edit.cells.items():
+        if column in frame.columns:
+            if isinstance(frame[column].dtype, pd.CategoricalDtype):
+                # Keep categoricals compact by adding new answers as categories
+                new_categories = pd.Index(values).dropna().unique().difference(frame[column].cat.categories)
+                if len(new_categories):
+                    frame[column] = frame[column].cat.add_categories(new_categories)
+            frame.loc[labels, column] = values
+        else:
+            frame[column] = pd.Series(values, index=labels).reindex(frame.index)
+    if edit.added_rows is not None:
+        frame = pd.concat([frame, edit.added_rows])
+    return frame if list(frame.columns) == edit.columns else frame[edit.columns]
+
+
+def _after_last(row_ids, minimum):
+    # The first unused row ID: one past the largest in row_ids, and at least minimum
+    return max(int(row_ids.max()) + 1, minimum) if len(row_ids) else minimum
+
+
+class EventSheet:
+    """An uploaded sheet kept as the original frame plus an undoable log of edits.
+
+    `view` is the cleaned data and must be treated as read-only: change it by
+    passing a modified copy to edit(). `version` increases whenever the view
+    changes, so widgets that hold their own edit state can be keyed on it,
+    and derived data such as `issues`, `event_index` and exports is recomputed only when it moves.
+    Rows are addressed by their row ID (the index, see data_loading.ROW_ID), never by position.
+    A sheet that continues an earlier one takes its next_row_id, so no row ID is ever handed out twice.
+    """
+
+    def __init__(self, original, next_row_id=1):
+        self.original = original
+        self.edits = []
+        self._redo = []
+        self._view = original
+        self.version = 0
+        self._issues = None
+        self._issues_version = None
+        self._exports = {}
+        self._exports_version = None
+        self._event_index = None
+        self._event_index_version = None
+        # Row IDs handed out so far are never reused, even after the rows are deleted or the edit undone
+        self._next_row_id = _after_last(original.index, next_row_id)
+
+    @property
+    def view(self):
+        if self._view is None:
+            view = self.original
+            for edit in self.edits:
+                view = apply_edit(view, edit)
+            self._view = view
+        return self._view
+
+    @property
+    def issues(self):
+        """Issue matrix of the view (see validation.validate), computed once per version."""
+        if self._issues_version != self.version:
+            self._issues = validate(self.view)
+            self._issues_version = self.version
+        return self._issues
+
+    @property
+    def event_index(self):
+        """Navigation index of the view (see event_navigation.index_events), built once per version."""
+        if self._event_index_version != self.version:
+            self._event_index = index_events(self.view)
+            self._event_index_version = self.version
+        return self._event_index
+
+    def export(self, fmt="csv"):
+        """The view as download bytes (see sheet_export.export_sheet), built on first request per version and format."""
+        if self._exports_version != self.version:
+            self._exports = {}
+            self._exports_version = self.version
+        if fmt not in self._exports:
+            self._exports[fmt] = export_sheet(self.view, fmt)
+        return self._exports[fmt]
+
+    def working_copy(self):
+        """A copy of the view to modify and pass back to edit(); categoricals are decoded so any value can be written."""
+        return decode_categories(self.view)
+
+    def edit(self, frame, description):
+        """Log the changes from the view to frame as one edit. Returns False if nothing changed."""
+        return self._log(diff_frames(self.view, frame, description))
+
+    def edit_rows(self, before, after, description):
+        """Log the changes from before, some rows of the view, to after as one edit. Returns False if nothing changed.
+
+        Only those rows are compared, so editing a page of a large sheet costs
+        the page, not the sheet. Rows in after but not in before are new and
+        are given fresh row IDs, so they never clash with rows outside before
+        or with rows deleted earlier.
+        """
+        added = after.index.difference(before.index, sort=False)
+        if len(added):
+            start = self._next_row_id
+            after = after.rename(index=dict(zip(added, range(start, start + len(added)))))
+        return self._log(diff_frames(before, after, description))
+
+    def _log(self, edit):
+        if edit is None:
+            return False
+        self._view = apply_edit(self.view, edit)
+        self._next_row_id = _after_last(self._view.index, self._next_row_id)
+        self.edits.append(edit)
+        self._redo.clear()
+        self.version += 1
+        return True
+
+    @property
+    def next_row_id(self):
+        """The row ID the next added row will get."""
+        return self._next_row_id
+
+    @property
+    def can_undo(self):
+        return bool(self.edits)
+
+    @property
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo(self):
+        self._redo.append(self.edits.pop())
+        self._view = None
+        self.version += 1
+
+    def redo(self):
+        edit = self._redo.pop()
+        self._view = apply_edit(self.view, edit)
+        self.edits.append(edit)
+        self.version += 1
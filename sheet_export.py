@@ -0,0 +1,32 @@
+"""Cleaned event sheet downloads as CSV, gzipped CSV or Parquet."""
+import gzip
+
+from column_schema import form_headers
+
+# gzip level for "csv.gz": level 1 is several times faster than the default 9 for a slightly larger file
+GZIP_LEVEL = 1
+
+# Format key -> (label, file name, MIME type)
+EXPORT_FORMATS = {
+    "csv": ("CSV", "yspd_events_cleaned.csv", "text/csv"),
+    "csv.gz": ("CSV (gzip)", "yspd_events_cleaned.csv.gz", "application/gzip"),
+    "parquet": ("Parquet", "yspd_events_cleaned.parquet", "application/vnd.apache.parquet"),
+}
+
+
+def export_sheet(df, fmt="csv"):
+    """df as file bytes in one of EXPORT_FORMATS, with field names renamed back to the form's headers.
+
+    CSV keeps the form's layout so the file can be uploaded again; Parquet
+    keeps the column dtypes, categoricals included.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"unknown export format {fmt!r}; choose from: {', '.join(EXPORT_FORMATS)}")
+    df = form_headers(df)
+    if fmt == "parquet":
+        return df.to_parquet(index=False)
+    data = df.to_csv(index=False).encode("utf-8")
+    if fmt == "csv.gz":
+        # A fixed mtime keeps the archive identical for identical data
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    return data
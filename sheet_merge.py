@@ -0,0 +1,97 @@
+"""Merge an updated event spreadsheet into a cleaned session DataFrame.
+
+Rows are matched by key columns and merged three ways: the previous upload
+(base), the cleaned copy the user has been editing, and the new upload. A
+cell takes the new upload's value only when the new file changed it since
+the base, so manual cleanup edits survive a re-upload.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from data_loading import ROW_ID, decode_categories
+
+# Columns that identify an event across versions of the sheet
+KEY_COLUMNS = ["park_name", "coordinator_email"]
+
+SheetDiff = namedtuple("SheetDiff", ["added", "changed", "removed", "unchanged", "conflicts"])
+
+
+def row_keys(df, key_columns=KEY_COLUMNS):
+    """One key per row from the normalized key columns, numbered so repeated keys stay distinct."""
+    parts = []
+    for column in key_columns:
+        values = df[column] if column in df.columns else pd.Series("", index=df.index)
+        parts.append(values.astype(object).fillna("").astype(str).str.strip().str.lower().str.replace(r"\s+", " ", regex=True))
+    keys = parts[0].str.cat(parts[1:], sep="\x1f") if len(parts) > 1 else parts[0]
+    return keys + "\x1f" + keys.groupby(keys).cumcount().astype(str)
+
+
+def same_values(left, right):
+    """Cell-wise equality of two aligned Series or DataFrames as a NumPy array, where two missing values count as equal."""
+    left, right = left.astype(object), right.astype(object)
+    return (left.to_numpy() == right.to_numpy()) | (left.isna().to_numpy() & right.isna().to_numpy())
+
+
+def merge_upload(base, cleaned, new, key_columns=KEY_COLUMNS, next_row_id=1):
+    """Apply the changes between base and new to cleaned.
+
+    Returns (merged, new_base, diff). merged holds the new file's rows in its
+    order, with cleanup edits kept on cells the new file did not change,
+    followed by rows added by hand. Rows removed by hand stay removed. Rows
+    keep their row IDs; rows new in the file are numbered from next_row_id,
+    or after the largest ID in base and cleaned if that is higher.
+    new_base is the whole new upload indexed by row ID, to use as the base
+    for the next merge; it still holds the rows removed by hand, which merged
+    leaves out. diff is a SheetDiff of event counts, where conflicts
+    counts cells changed both by hand and in the new file (the new file wins).
+    """
+    new = new.reset_index(drop=True)
+    columns = list(dict.fromkeys([*new.columns, *cleaned.columns]))
+
+    # Position in base of the row each new row continues, or NaN for added rows
+    base_positions = row_keys(new, key_columns).map(pd.Series(np.arange(len(base)), index=row_keys(base, key_columns)))
+    matched = base_positions.notna().to_numpy()
+    matched_labels = pd.Series(base.index[base_positions[matched].astype(int)], index=base_positions.index[matched])
+
+    # Continuing rows keep their row IDs; added rows get new ones after every ID handed out so far
+    row_ids = np.empty(len(new), dtype=np.int64)
+    row_ids[matched] = matched_labels.to_numpy()
+    first_new = max(next_row_id, int(np.concatenate([base.index, cleaned.index, [0]]).max()) + 1)
+    row_ids[~matched] = np.arange(first_new, first_new + (~matched).sum())
+    row_ids = pd.Index(row_ids, name=ROW_ID)
+    # The next base keeps rows deleted during cleanup, so the next merge still recognizes them as deleted
+    new_base = new.set_axis(row_ids)
+
+    # Rows deleted during cleanup stay deleted
+    deleted = pd.Series(False, index=new.index)
+    deleted[matched_labels.index] = ~matched_labels.isin(cleaned.index).to_numpy()
+    new, matched, row_ids = new[~deleted.to_numpy()], matched[~deleted.to_numpy()], row_ids[~deleted.to_numpy()]
+    labels = matched_labels[~deleted[matched_labels.index].to_numpy()].to_numpy()
+
+    theirs = new[matched].reindex(columns=columns)
+    before = base.loc[labels].reindex(columns=columns)
+    ours = decode_categories(cleaned.loc[labels]).reindex(columns=columns)
+    upstream = ~same_values(theirs, before)
+    # Columns missing from the new file (e.g. a Park Zip Code added during cleanup) keep their cleaned values
+    upstream[:, [column not in new.columns for column in columns]] = False
+    edited = ~same_values(ours, before)
+
+    merged_matched = ours.where(~upstream, theirs.to_numpy())
+    merged_matched.index = new.index[matched]
+
+    added = new[~matched].reindex(columns=columns)
+    hand_added = cleaned.loc[~cleaned.index.isin(base.index)].reindex(columns=columns)
+    merged = pd.concat([merged_matched, added]).sort_index()
+    merged.index = row_ids
+    merged = pd.concat([merged, hand_added])
+    changed_rows = upstream.any(axis=1)
+    diff = SheetDiff(
+        added=int((~matched).sum()),
+        changed=int(changed_rows.sum()),
+        removed=int(len(base) - len(labels) - deleted.sum()),
+        unchanged=int((~changed_rows).sum()),
+        conflicts=int((upstream & edited & ~same_values(ours, theirs)).sum()),
+    )
+    return merged, new_base, diff
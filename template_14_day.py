@@ -1,20 +1,7 @@
-from utils import safe_get
+from event_records import EventRecord
+from template_engine import CompiledTemplate
 
-def generate_14_day_template(event):
-    """Generate the 14-day reminder email template with inline styling matching YSPDMain.html"""
-    
-    # Map CSV columns to template variables
-    park_name = safe_get(event, "Chapter/Park Name")
-    coordinator_name = safe_get(event, "Volunteer Coordinator Name")
-    coordinator_email = safe_get(event, "Volunteer Coordinator Email")
-    coordinator_phone = safe_get(event, "Volunteer Coordinator Phone")
-    project_description = safe_get(event, "Describe the project(s) that are planned at your site.")
-    meeting_location = safe_get(event, "Specific meeting location - e.g., Visitor Center, Group Shelter 1.")
-    meeting_time = safe_get(event, "Meeting Time")
-    
-    event_date = "{event.start_date}"
-    
-    html_template = f"""<!DOCTYPE html>
+_PAGE = CompiledTemplate("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -202,6 +189,25 @@ def generate_14_day_template(event):
     </table>
     
 </body>
-</html>"""
-    
-    return html_template
\ No newline at end of file
+</html>""")
+
+# EventRecord fields this template reads
+FIELDS = (
+    "park_name",
+    "project_description",
+    "meeting_location",
+)
+
+
+def render(record):
+    """Render the 14-day reminder from an EventRecord"""
+    return _PAGE.render({
+        "park_name": record.park_name,
+        "project_description": record.project_description,
+        "meeting_location": record.meeting_location,
+    })
+
+
+def generate_14_day_template(event):
+    """Generate the 14-day reminder email template with inline styling matching YSPDMain.html"""
+    return render(EventRecord.from_event(event))
@@ -1,60 +1,32 @@
-from utils import safe_get
+from event_records import EventRecord
+from template_engine import CompiledTemplate
 
-def generate_3_day_template(event):
-    """Generate the 3-day reminder email template with inline styling matching YSPDMain.html"""
-    
-    park_name = safe_get(event, "Chapter/Park Name")
-    coordinator_name = safe_get(event, "Volunteer Coordinator Name")
-    coordinator_email = safe_get(event, "Volunteer Coordinator Email")
-    coordinator_phone = safe_get(event, "Volunteer Coordinator Phone")
-    project_description = safe_get(event, "Describe the project(s) that are planned at your site.")
-    meeting_location = safe_get(event, "Specific meeting location - e.g., Visitor Center, Group Shelter 1.")
-    meeting_time = safe_get(event, "Meeting Time")
-    what_to_bring = safe_get(event, "What Should A Volunteer Bring for the Day? e.g., gloves, sun screen, bug spray, etc.")
-    special_instructions = safe_get(event, "Special Instructions: e.g., closed-toe shoes, working near water, bring a change of clothes if desired, etc.")
-    refreshments = safe_get(event, "Will snacks, lunch, water, be provided?")
-    
-    event_date = "{event.start_date}"
-    
-    # Convert what_to_bring to bullet points
-    if what_to_bring:
-        bring_items = [item.strip() for item in what_to_bring.split(',') if item.strip()]
-    else:
-        bring_items = ["Work gloves", "Water bottle", "Closed-toe shoes"]
-    
-    bring_list = "".join([f"<tr><td style='padding: 4px 0; font-family: Arial, sans-serif; font-size: 14px; line-height: 1.6; color: #333;'>• {item}</td></tr>" for item in bring_items])
-    
-    # Handle special instructions section and other "Need to know" items
-    need_to_know_items = []
-    
-    if special_instructions:
-        need_to_know_items.append(f'''
+_BRING_ITEM = CompiledTemplate("<tr><td style='padding: 4px 0; font-family: Arial, sans-serif; font-size: 14px; line-height: 1.6; color: #333;'>• {item}</td></tr>")
+
+_SPECIAL_INSTRUCTIONS = CompiledTemplate('''
         <p style="margin: 0 0 15px 0; font-family: Arial, sans-serif; font-size: 14px; line-height: 1.6; color: #333;">
             <strong style="color: #005987;">Special Instructions:</strong> {special_instructions}
         </p>''')
-    
-    if refreshments:
-        need_to_know_items.append(f'''
+
+_REFRESHMENTS = CompiledTemplate('''
         <p style="margin: 0 0 15px 0; font-family: Arial, sans-serif; font-size: 14px; line-height: 1.6; color: #333;">
             <strong style="color: #005987;">Refreshments provided:</strong> {refreshments}
         </p>''')
-    
-    # Note: Family-friendly sections would be added here if they exist in the data
-    
-    need_to_know_section = f"""
+
+_NEED_TO_KNOW_SECTION = CompiledTemplate("""
     <table style="width: 100%; border-collapse: collapse; margin-bottom: 20px;">
         <tr>
             <td style="padding: 20px; background-color: #f8f9fa; border-left: 3px solid #005987; border-radius: 10px; font-family: Arial, sans-serif;">
                 <p style="margin: 0 0 15px 0; font-family: Arial, sans-serif; font-size: 16px; font-weight: 600; color: #005987;">
                     Need to Know:
                 </p>
-                {''.join(need_to_know_items)}
+                {need_to_know_items}
             </td>
         </tr>
     </table>
-    """ if need_to_know_items else ''
-    
-    html_template = f"""<!DOCTYPE html>
+    """)
+
+_PAGE = CompiledTemplate("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -195,6 +167,57 @@ def generate_3_day_template(event):
     </table>
     
 </body>
-</html>"""
+</html>""")
+
+# EventRecord fields this template reads
+FIELDS = (
+    "park_name",
+    "project_description",
+    "meeting_location",
+    "what_to_bring",
+    "special_instructions",
+    "refreshments",
+)
+
+
+def render(record):
+    """Render the 3-day reminder from an EventRecord"""
+    what_to_bring = record.what_to_bring
+    special_instructions = record.special_instructions
+    refreshments = record.refreshments
     
-    return html_template
\ No newline at end of file
+    # Convert what_to_bring to bullet points
+    if what_to_bring:
+        bring_items = [item.strip() for item in what_to_bring.split(',') if item.strip()]
+    else:
+        bring_items = ["Work gloves", "Water bottle", "Closed-toe shoes"]
+    
+    bring_list = "".join([_BRING_ITEM.render({"item": item}) for item in bring_items])
+    
+    # Handle special instructions section and other "Need to know" items
+    need_to_know_items = []
+    
+    if special_instructions:
+        need_to_know_items.append(_SPECIAL_INSTRUCTIONS.render({"special_instructions": special_instructions}))
+    
+    if refreshments:
+        need_to_know_items.append(_REFRESHMENTS.render({"refreshments": refreshments}))
+    
+    # Note: Family-friendly sections would be added here if they exist in the data
+    
+    need_to_know_section = _NEED_TO_KNOW_SECTION.render({
+        "need_to_know_items": "".join(need_to_know_items),
+    }) if need_to_know_items else ''
+    
+    return _PAGE.render({
+        "park_name": record.park_name,
+        "project_description": record.project_description,
+        "meeting_location": record.meeting_location,
+        "bring_list": bring_list,
+        "need_to_know_section": need_to_know_section,
+    })
+
+
+def generate_3_day_template(event):
+    """Generate the 3-day reminder email template with inline styling matching YSPDMain.html"""
+    return render(EventRecord.from_event(event))
@@ -1,43 +1,14 @@
-from utils import safe_get
+from event_records import EventRecord
+from template_engine import CompiledTemplate
 
-def generate_registration_confirmation(event):
-    """Generate the registration confirmation email with inline styling matching YSPDMain.html"""
-    
-    park_name = safe_get(event, "Chapter/Park Name")
-    coordinator_name = safe_get(event, "Volunteer Coordinator Name")
-    coordinator_email = safe_get(event, "Volunteer Coordinator Email")
-    coordinator_phone = safe_get(event, "Volunteer Coordinator Phone")
-    project_description = safe_get(event, "Describe the project(s) that are planned at your site.")
-    meeting_location = safe_get(event, "Specific meeting location - e.g., Visitor Center, Group Shelter 1.")
-    meeting_time = safe_get(event, "Meeting Time")
-    what_to_bring = safe_get(event, "What Should A Volunteer Bring for the Day? e.g., gloves, sun screen, bug spray, etc.")
-    special_instructions = safe_get(event, "Special Instructions: e.g., closed-toe shoes, working near water, bring a change of clothes if desired, etc.")
-    
-    event_date = "{event.start_date}"
-    
-    # Improved what_to_bring list generation
-    bring_items = ["Work gloves (if you have them)", "Water bottle", "Sunscreen and bug spray", "Closed-toe shoes"]
-    
-    # Check for additional user-provided items and avoid duplicates
-    if what_to_bring:
-        user_items = [item.strip() for item in what_to_bring.split(',') if item.strip()]
-        for item in user_items:
-            # Check if it's not a duplicate of standard items
-            if item.lower() not in [b.split(' ')[0].lower() for b in bring_items]:
-                bring_items.append(item)
-    
-    bring_list = "".join([f"<tr><td style='padding: 4px 0; font-family: Arial, sans-serif; font-size: 14px; line-height: 1.6; color: #333;'>• {item}</td></tr>" for item in bring_items])
-    
-    # Handle special instructions section and other "Need to know" items
-    need_to_know_items = []
-    
-    if special_instructions:
-        need_to_know_items.append(f'''
+_BRING_ITEM = CompiledTemplate("<tr><td style='padding: 4px 0; font-family: Arial, sans-serif; font-size: 14px; line-height: 1.6; color: #333;'>• {item}</td></tr>")
+
+_SPECIAL_INSTRUCTIONS = CompiledTemplate('''
         <p style="margin: 0 0 15px 0; font-family: Arial, sans-serif; font-size: 14px; line-height: 1.6; color: #333;">
             <strong style="color: #005987;">Special Instructions:</strong> {special_instructions}
         </p>''')
-    
-    html_template = f"""<!DOCTYPE html>
+
+_PAGE = CompiledTemplate("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -111,7 +82,7 @@ def generate_registration_confirmation(event):
                             <p style="margin: 20px 0 10px 0; font-family: Arial, sans-serif; font-size: 16px; font-weight: 600; color: #005987;">
                                 Need to Know:
                             </p>
-                            {''.join(need_to_know_items) if need_to_know_items else ''}
+                            {need_to_know}
                             
                             <p style="margin: 20px 0 10px 0; font-family: Arial, sans-serif; font-size: 16px; font-weight: 600; color: #005987;">
                                 General Guidelines:
@@ -264,6 +235,47 @@ def generate_registration_confirmation(event):
     </table>
     
 </body>
-</html>"""
+</html>""")
+
+# EventRecord fields this template reads
+FIELDS = (
+    "park_name",
+    "what_to_bring",
+    "special_instructions",
+)
+
+
+def render(record):
+    """Render the registration confirmation from an EventRecord"""
+    what_to_bring = record.what_to_bring
+    special_instructions = record.special_instructions
+    
+    # Improved what_to_bring list generation
+    bring_items = ["Work gloves (if you have them)", "Water bottle", "Sunscreen and bug spray", "Closed-toe shoes"]
+    
+    # Check for additional user-provided items and avoid duplicates
+    if what_to_bring:
+        user_items = [item.strip() for item in what_to_bring.split(',') if item.strip()]
+        for item in user_items:
+            # Check if it's not a duplicate of standard items
+            if item.lower() not in [b.split(' ')[0].lower() for b in bring_items]:
+                bring_items.append(item)
+    
+    bring_list = "".join([_BRING_ITEM.render({"item": item}) for item in bring_items])
+    
+    # Handle special instructions section and other "Need to know" items
+    need_to_know_items = []
     
-    return html_template
\ No newline at end of file
+    if special_instructions:
+        need_to_know_items.append(_SPECIAL_INSTRUCTIONS.render({"special_instructions": special_instructions}))
+    
+    return _PAGE.render({
+        "park_name": record.park_name,
+        "bring_list": bring_list,
+        "need_to_know": "".join(need_to_know_items),
+    })
+
+
+def generate_registration_confirmation(event):
+    """Generate the registration confirmation email with inline styling matching YSPDMain.html"""
+    return render(EventRecord.from_event(event))
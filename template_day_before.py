@@ -1,21 +1,7 @@
-from utils import safe_get
+from event_records import EventRecord
+from template_engine import CompiledTemplate
 
-def generate_day_before_template(event):
-    """Generate the day before reminder email template with inline styling matching YSPDMain.html"""
-    
-    park_name = safe_get(event, "Chapter/Park Name")
-    coordinator_name = safe_get(event, "Volunteer Coordinator Name")
-    coordinator_phone = safe_get(event, "Volunteer Coordinator Phone")
-    meeting_location = safe_get(event, "Specific meeting location - e.g., Visitor Center, Group Shelter 1.")
-    meeting_time = safe_get(event, "Meeting Time")
-    park_zip = safe_get(event, "Park Zip Code", "")
-    
-    event_date = "{event.start_date}"
-    
-    # Create weather URL if we have a zip code
-    weather_url = f"https://forecast.weather.gov/zipcity.php?inputstring={park_zip}" if park_zip else "https://forecast.weather.gov/"
-    
-    html_template = f"""<!DOCTYPE html>
+_PAGE = CompiledTemplate("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -184,6 +170,32 @@ def generate_day_before_template(event):
     </table>
     
 </body>
-</html>"""
+</html>""")
+
+# EventRecord fields this template reads
+FIELDS = (
+    "park_name",
+    "meeting_location",
+    "meeting_time",
+    "park_zip",
+)
+
+
+def render(record):
+    """Render the day before reminder from an EventRecord"""
+    park_zip = record.park_zip
+    
+    # Create weather URL if we have a zip code
+    weather_url = f"https://forecast.weather.gov/zipcity.php?inputstring={park_zip}" if park_zip else "https://forecast.weather.gov/"
     
-    return html_template
\ No newline at end of file
+    return _PAGE.render({
+        "park_name": record.park_name,
+        "meeting_location": record.meeting_location,
+        "weather_url": weather_url,
+        "meeting_time": record.meeting_time,
+    })
+
+
+def generate_day_before_template(event):
+    """Generate the day before reminder email template with inline styling matching YSPDMain.html"""
+    return render(EventRecord.from_event(event))
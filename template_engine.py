@@ -0,0 +1,37 @@
+from string import Formatter
+
+
+class CompiledTemplate:
+    """A template split once into static segments and named slots.
+
+    The source uses the same syntax as the f-strings the templates were written
+    with: ``{name}`` marks a slot and ``{{``/``}}`` are literal braces. Rendering
+    only fills the slots and joins the precomputed segments, so the large static
+    HTML/CSS chunks are never rebuilt per event.
+    """
+
+    def __init__(self, source):
+        segments = []
+        slots = []
+        literal = []
+        for text, field_name, format_spec, conversion in Formatter().parse(source):
+            literal.append(text)
+            if field_name is None:
+                continue
+            if not field_name or format_spec or conversion:
+                raise ValueError(f"Unsupported template slot: {{{field_name}}}")
+            segments.append("".join(literal))
+            literal = []
+            slots.append((len(segments), field_name))
+            segments.append("")
+        segments.append("".join(literal))
+
+        self._segments = segments
+        self._slots = tuple(slots)
+
+    def render(self, values):
+        """Render the template, filling each slot from the ``values`` mapping."""
+        parts = self._segments[:]
+        for position, name in self._slots:
+            parts[position] = values[name]
+        return "".join(parts)
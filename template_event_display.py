@@ -1,72 +1,41 @@
-from utils import safe_get
+from event_records import EventRecord
+from template_engine import CompiledTemplate
 
-def generate_event_display(event):
-    """Generate the event display page for website/registration with styling matching YSPDMain.html"""
-    
-    park_name = safe_get(event, "Chapter/Park Name")
-    coordinator_name = safe_get(event, "Volunteer Coordinator Name")
-    coordinator_email = safe_get(event, "Volunteer Coordinator Email")
-    coordinator_phone = safe_get(event, "Volunteer Coordinator Phone")
-    project_description = safe_get(event, "Describe the project(s) that are planned at your site.")
-    meeting_location = safe_get(event, "Specific meeting location - e.g., Visitor Center, Group Shelter 1.")
-    meeting_time = safe_get(event, "Meeting Time")
-    end_time = safe_get(event, "What time will the activities end?", "End of day")
-    what_to_bring = safe_get(event, "What Should A Volunteer Bring for the Day? e.g., gloves, sun screen, bug spray, etc.")
-    special_instructions = safe_get(event, "Special Instructions: e.g., closed-toe shoes, working near water, bring a change of clothes if desired, etc.")
-    refreshments = safe_get(event, "Will snacks, lunch, water, be provided?")
-    children_activities = safe_get(event, "Will you have activities for children? Age limit?")
-    
-    event_date = "September 27, 2025"
-    
-    # Convert what_to_bring to bullet points
-    if what_to_bring:
-        bring_items = [item.strip() for item in what_to_bring.split(',') if item.strip()]
-    else:
-        bring_items = ["Work gloves", "Water bottle", "Closed-toe shoes"]
-    
-    # Handle "Need to know" section grouping
-    need_to_know_sections = []
-    
-    # Add "What to Bring" section
-    if bring_items:
-        bring_list_html = "".join([f"<li style='margin-bottom: 8px; font-size: 14px; line-height: 1.6; color: #333;'>{item}</li>" for item in bring_items])
-        need_to_know_sections.append(f'''
+_BRING_ITEM = CompiledTemplate("<li style='margin-bottom: 8px; font-size: 14px; line-height: 1.6; color: #333;'>{item}</li>")
+
+_WHAT_TO_BRING = CompiledTemplate('''
     <div style="background-color: #f8f9fa; padding: 20px; margin: 20px 0; border-left: 3px solid #005987; border-radius: 10px;">
         <strong style="color: #005987; font-size: 16px;">What to Bring:</strong> 
         <ul style="margin: 10px 0; padding-left: 20px;">
             {bring_list_html}
         </ul>
     </div>''')
-    
-    if special_instructions:
-        need_to_know_sections.append(f'''
+
+_SPECIAL_INSTRUCTIONS = CompiledTemplate('''
     <div style="background-color: #f8f9fa; padding: 20px; margin: 20px 0; border-left: 3px solid #005987; border-radius: 10px;">
         <strong style="color: #005987; font-size: 16px;">Special Instructions:</strong> 
         <p style="margin: 10px 0 0 0; font-size: 14px; line-height: 1.6; color: #333;">{special_instructions}</p>
     </div>''')
-    
-    if refreshments:
-        need_to_know_sections.append(f'''
+
+_REFRESHMENTS = CompiledTemplate('''
     <div style="background-color: #f8f9fa; padding: 20px; margin: 20px 0; border-left: 3px solid #005987; border-radius: 10px;">
         <strong style="color: #005987; font-size: 16px;">Refreshments provided:</strong> 
         <p style="margin: 10px 0 0 0; font-size: 14px; line-height: 1.6; color: #333;">{refreshments}</p>
     </div>''')
-    
-    if children_activities:
-        need_to_know_sections.append(f'''
+
+_CHILDREN_ACTIVITIES = CompiledTemplate('''
     <div style="background-color: #f8f9fa; padding: 20px; margin: 20px 0; border-left: 3px solid #005987; border-radius: 10px;">
         <strong style="color: #005987; font-size: 16px;">Family-Friendly:</strong> 
         <p style="margin: 10px 0 0 0; font-size: 14px; line-height: 1.6; color: #333;">{children_activities}</p>
     </div>''')
-    
-    # Combine all sections under "What to Expect"
-    need_to_know_combined = f'''
+
+_WHAT_TO_EXPECT = CompiledTemplate('''
     <div style="background-color: white; padding: 25px; border: 2px solid #005987; margin: 20px 0; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,89,135,0.1);">
         <div style="color: #005987; font-size: 1.25rem; font-weight: 600; margin-bottom: 15px; border-bottom: 2px solid #005987; padding-bottom: 8px;">What to Expect</div>
-        {''.join(need_to_know_sections)}
-    </div>''' if need_to_know_sections else ''
-    
-    html_template = f"""<!DOCTYPE html>
+        {need_to_know_sections}
+    </div>''')
+
+_PAGE = CompiledTemplate("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -134,6 +103,70 @@ def generate_event_display(event):
     </div>
     
 </body>
-</html>"""
+</html>""")
+
+# EventRecord fields this template reads
+FIELDS = (
+    "park_name",
+    "project_description",
+    "meeting_location",
+    "meeting_time",
+    "end_time",
+    "what_to_bring",
+    "special_instructions",
+    "refreshments",
+    "children_activities",
+)
+
+EVENT_DATE = "September 27, 2025"
+
+
+def render(record):
+    """Render the event display page from an EventRecord"""
+    what_to_bring = record.what_to_bring
+    special_instructions = record.special_instructions
+    refreshments = record.refreshments
+    children_activities = record.children_activities
+    
+    # Convert what_to_bring to bullet points
+    if what_to_bring:
+        bring_items = [item.strip() for item in what_to_bring.split(',') if item.strip()]
+    else:
+        bring_items = ["Work gloves", "Water bottle", "Closed-toe shoes"]
+    
+    # Handle "Need to know" section grouping
+    need_to_know_sections = []
     
-    return html_template
\ No newline at end of file
+    # Add "What to Bring" section
+    if bring_items:
+        bring_list_html = "".join([_BRING_ITEM.render({"item": item}) for item in bring_items])
+        need_to_know_sections.append(_WHAT_TO_BRING.render({"bring_list_html": bring_list_html}))
+    
+    if special_instructions:
+        need_to_know_sections.append(_SPECIAL_INSTRUCTIONS.render({"special_instructions": special_instructions}))
+    
+    if refreshments:
+        need_to_know_sections.append(_REFRESHMENTS.render({"refreshments": refreshments}))
+    
+    if children_activities:
+        need_to_know_sections.append(_CHILDREN_ACTIVITIES.render({"children_activities": children_activities}))
+    
+    # Combine all sections under "What to Expect"
+    need_to_know_combined = _WHAT_TO_EXPECT.render({
+        "need_to_know_sections": "".join(need_to_know_sections),
+    }) if need_to_know_sections else ''
+    
+    return _PAGE.render({
+        "park_name": record.park_name,
+        "event_date": EVENT_DATE,
+        "meeting_time": record.meeting_time,
+        "end_time": record.end_time,
+        "meeting_location": record.meeting_location,
+        "project_description": record.project_description,
+        "need_to_know_combined": need_to_know_combined,
+    })
+
+
+def generate_event_display(event):
+    """Generate the event display page for website/registration with styling matching YSPDMain.html"""
+    return render(EventRecord.from_event(event))
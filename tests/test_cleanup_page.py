@@ -0,0 +1,82 @@
+"""Behavior checks for the Data Cleanup page, run through Streamlit's AppTest."""
+import os
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "yspd_event_generator.py")
+
+
+def _sheet_csv():
+    return pd.DataFrame({
+        "Volunteer Coordinator Name": ["Jane Smith", "Bob Jones", "Li Lee"],
+        "Volunteer Coordinator Email": ["jane@gmail.com", "bob@yahoo.com", "li@aol.com"],
+        "Volunteer Coordinator Phone": ["(404) 555-0101", "(404) 555-0102", "(404) 555-0103"],
+        "Chapter/Park Name": ["Vogel State Park", "Oak Hollow Nature Preserve", "Pine Bluff Greenway"],
+        "Describe the project(s) that are planned at your site.": ["Trail work", "Litter pickup", "Planting"],
+        "Specific meeting location - e.g., Visitor Center, Group Shelter 1.": ["Visitor Center", None, "Kiosk"],
+        "Meeting Time": ["9:00 AM", "9:00 AM", "10:00 AM"],
+        "Park Zip Code": [None, None, None],
+    }).to_csv(index=False).encode()
+
+
+def _cleanup_page():
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.run()
+    at.file_uploader[0].set_value(("events.csv", _sheet_csv(), "text/csv")).run()
+    at.sidebar.radio[0].set_value("3. Data Cleanup").run()
+    assert not at.exception
+    return at
+
+
+def test_manual_zip_entry_saves_to_that_park_row():
+    at = _cleanup_page()
+    sheet = at.session_state["sheet"]
+
+    # Row ID 2 is a park the directory does not know, so it gets its own zip field
+    at.text_input(key="zip_2").input("30309").run()
+
+    assert not at.exception
+    assert sheet.view.loc[2, "park_zip"] == "30309"
+    assert sheet.view["park_zip"].drop(index=2).isna().all()
+    assert sheet.edits[-1].description == "Zip code for Oak Hollow Nature Preserve"
+
+
+def _single_event_editor(at, row_id):
+    at.radio[0].set_value("📝 Single Event Editor").run()
+    at.text_input(key="event_search").input(str(row_id)).run()
+    assert not at.exception
+    return {widget.label: widget for widget in [*at.text_input, *at.text_area]}
+
+
+def _save(at):
+    [button for button in at.button if "Save Changes" in button.label][0].click().run()
+    assert not at.exception
+
+
+def test_saving_an_unchanged_event_logs_no_edit():
+    at = _cleanup_page()
+    sheet = at.session_state["sheet"]
+    fields = _single_event_editor(at, 2)
+
+    # Missing cells are shown blank, not as "nan"
+    assert fields["Meeting Location"].value == ""
+    _save(at)
+
+    assert sheet.edits == []
+    assert pd.isna(sheet.view.loc[2, "meeting_location"])
+
+
+def test_saving_an_event_writes_only_changed_fields():
+    at = _cleanup_page()
+    sheet = at.session_state["sheet"]
+    fields = _single_event_editor(at, 2)
+
+    fields["Coordinator Name"].input("Robert Jones").run()
+    _save(at)
+
+    edit = sheet.edits[-1]
+    assert edit.description == "Edit event 2"
+    assert list(edit.cells) == ["coordinator_name"]
+    assert sheet.view.loc[2, "coordinator_name"] == "Robert Jones"
+    assert pd.isna(sheet.view.loc[2, "meeting_location"])
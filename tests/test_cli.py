@@ -0,0 +1,50 @@
+"""Tests for the headless generator, yspd.py."""
+import pytest
+
+import yspd
+
+SHEET = """Chapter/Park Name,Volunteer Coordinator Email,Meeting Time
+,jane@gmail.com,9:00 AM
+FDR SP,bob@yahoo.com,9:00 AM
+F.D. Roosevelt State Park,li@aol.com,10:00 AM
+Vogel State Park,pat@gmail.com,9:00 AM
+"""
+
+
+@pytest.fixture
+def sheet_path(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text(SHEET)
+    return path
+
+
+def test_blank_park_names_get_a_filename(sheet_path, tmp_path):
+    out = tmp_path / "out"
+
+    assert yspd.main(["generate", str(sheet_path), "--templates", "event_display", "--out", str(out)]) == 0
+
+    assert sorted(path.name for path in out.iterdir()) == [
+        "FDR_SP_2_event_display.html",
+        "FD_Roosevelt_State_Park_3_event_display.html",
+        "Vogel_State_Park_4_event_display.html",
+        "_1_event_display.html",
+    ]
+
+
+def test_parks_match_spelling_variants(sheet_path, tmp_path):
+    out = tmp_path / "out"
+
+    yspd.main(["generate", str(sheet_path), "--templates", "event_display", "--parks", "FDR State Park", "--out", str(out)])
+
+    assert sorted(path.name for path in out.iterdir()) == [
+        "FDR_SP_2_event_display.html",
+        "FD_Roosevelt_State_Park_3_event_display.html",
+    ]
+
+
+def test_missing_input_is_a_usage_error(tmp_path, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        yspd.main(["generate", str(tmp_path / "missing.csv"), "--out", str(tmp_path / "out")])
+
+    assert exit_info.value.code == 2
+    assert "can't open" in capsys.readouterr().err
@@ -0,0 +1,39 @@
+"""Tests for resolving form headers to field names."""
+import pandas as pd
+
+from column_schema import FIELDS, form_headers, resolve_headers
+
+
+def test_form_headers_resolve_to_field_names():
+    headers = [field.header for field in FIELDS.values()]
+
+    assert list(resolve_headers(headers).values()) == list(FIELDS)
+
+
+def test_headers_match_without_case_punctuation_or_examples():
+    resolved = resolve_headers(["chapter / park name", "Specific meeting location - e.g., the big oak"])
+
+    assert list(resolved.values()) == ["park_name", "meeting_location"]
+
+
+def test_exact_headers_win_over_earlier_aliases():
+    headers = ["Timestamp", "Email Address", "Volunteer Coordinator Name", "Volunteer Coordinator Email"]
+
+    assert resolve_headers(headers) == {
+        "Volunteer Coordinator Name": "coordinator_name",
+        "Volunteer Coordinator Email": "coordinator_email",
+    }
+
+
+def test_aliases_match_when_no_exact_header_does():
+    assert resolve_headers(["Email Address", "Park", "Phone"]) == {
+        "Email Address": "coordinator_email",
+        "Park": "park_name",
+        "Phone": "coordinator_phone",
+    }
+
+
+def test_form_headers_rename_fields_back():
+    df = pd.DataFrame(columns=["park_name", "Timestamp"])
+
+    assert list(form_headers(df).columns) == ["Chapter/Park Name", "Timestamp"]
@@ -0,0 +1,62 @@
+"""Behavior checks for the Generate Templates page, run through Streamlit's AppTest."""
+import os
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "yspd_event_generator.py")
+
+
+def _sheet_csv(meeting_time="9:00 AM"):
+    return pd.DataFrame({
+        "Volunteer Coordinator Name": ["Jane Smith", "Bob Jones"],
+        "Volunteer Coordinator Email": ["jane@gmail.com", "bob@yahoo.com"],
+        "Chapter/Park Name": ["Vogel State Park", "Hart State Park"],
+        "Describe the project(s) that are planned at your site.": ["Trail work", "Litter pickup"],
+        "Specific meeting location - e.g., Visitor Center, Group Shelter 1.": ["Visitor Center", "Lot A"],
+        "Meeting Time": [meeting_time, "9:00 AM"],
+    }).to_csv(index=False).encode()
+
+
+def _generated_app():
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.run()
+    at.file_uploader[0].set_value(("events.csv", _sheet_csv(), "text/csv")).run()
+    at.sidebar.radio[0].set_value("4. Generate Templates").run()
+    [button for button in at.button if "Generate Templates" in button.label][0].click().run()
+    assert not at.exception
+    assert "generated" in at.session_state
+    return at
+
+
+def test_cleanup_edits_clear_generated_templates():
+    at = _generated_app()
+    sheet = at.session_state["sheet"]
+    edited = sheet.working_copy()
+    edited.loc[1, "meeting_time"] = "8:00 AM"
+    sheet.edit(edited, "Edit event 1")
+
+    at.run()
+
+    assert not at.exception
+    assert "generated" not in at.session_state
+    assert any("changed since the templates were generated" in info.value for info in at.info)
+
+
+def test_unchanged_sheet_keeps_generated_templates():
+    at = _generated_app()
+
+    at.run()
+
+    assert "generated" in at.session_state
+    assert any("Generated 10 template files" in success.value for success in at.success)
+
+
+def test_new_upload_clears_generated_templates():
+    at = _generated_app()
+
+    at.sidebar.radio[0].set_value("1. Upload Data").run()
+    at.file_uploader[0].set_value(("events.csv", _sheet_csv("10:00 AM"), "text/csv")).run()
+
+    assert not at.exception
+    assert "generated" not in at.session_state
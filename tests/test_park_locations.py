@@ -0,0 +1,30 @@
+"""Tests for resolving typed park names against the park directory."""
+import pandas as pd
+
+from park_locations import canonical_park_names, fill_park_zips, lookup_park_zips
+
+
+def test_spelling_variants_resolve_to_the_official_name():
+    names = pd.Series(["FDR State Park", "  vogel state park", "Oak Hollow Nature Preserve", None], dtype=object)
+
+    assert canonical_park_names(names).tolist()[:3] == [
+        "F.D. Roosevelt State Park", "Vogel State Park", "Oak Hollow Nature Preserve",
+    ]
+
+
+def test_zip_lookup_only_for_confident_matches():
+    names = pd.Series(["Franklin D. Roosevelt State Park", "Oak Hollow Nature Preserve"], dtype=object)
+
+    zips = lookup_park_zips(names)
+
+    assert zips.iloc[0] == "31822"
+    assert pd.isna(zips.iloc[1])
+
+
+def test_fill_park_zips_keeps_existing_zips():
+    df = pd.DataFrame({"park_name": ["Vogel State Park", "Vogel State Park"], "park_zip": [None, "99999"]})
+
+    filled = fill_park_zips(df)
+
+    assert filled == 1
+    assert df["park_zip"].tolist() == ["30512", "99999"]
@@ -0,0 +1,34 @@
+"""Tests for the bounded render cache."""
+from batch_render import TEMPLATES, render_records
+from event_records import EventRecord
+from render_cache import RenderCache
+
+
+def _records(count):
+    return [
+        EventRecord.from_event({"park_name": f"Park {i}", "coordinator_name": "Jane Smith", "meeting_time": "9:00 AM"})
+        for i in range(count)
+    ]
+
+
+def test_bulk_render_without_store_reuses_hits_and_keeps_nothing_new():
+    records = _records(5)
+    cache = RenderCache()
+    previewed = cache.render("event_display", records[0])
+
+    pages = list(cache.iter_rendered(records, list(TEMPLATES), store=False))
+
+    assert len(cache) == 1
+    assert cache.hits == 1
+    assert pages[0] == (0, "event_display", previewed)
+    assert [html for _, template, html in pages if template == "event_display"] == render_records(records, "event_display")
+
+
+def test_bulk_render_with_store_fills_the_cache_up_to_its_bound():
+    records = _records(5)
+    cache = RenderCache(max_entries=8)
+
+    list(cache.iter_rendered(records, list(TEMPLATES)))
+
+    assert len(cache) == 8
+    assert cache.misses == 5 * len(TEMPLATES)
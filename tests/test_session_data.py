@@ -0,0 +1,177 @@
+"""Tests for the session data model: sparse edits, undo/redo and row IDs."""
+import pandas as pd
+
+from data_loading import ROW_ID, TEXT_DTYPE
+from session_data import EventSheet, apply_edit, diff_frames
+
+
+def _frame():
+    return pd.DataFrame(
+        {
+            "park_name": pd.Series(["Vogel State Park", "Hart State Park", "Vogel State Park"], dtype="category"),
+            "coordinator_name": pd.Series(["Jane Smith", None, "Li Lee"], dtype=TEXT_DTYPE),
+            "meeting_time": pd.Series(["9:00 AM", "9:00 AM", "10:00 AM"], dtype=TEXT_DTYPE),
+        },
+    ).set_axis(pd.RangeIndex(1, 4, name=ROW_ID))
+
+
+def _assert_same_data(left, right):
+    pd.testing.assert_frame_equal(left.astype(object), right.astype(object))
+
+
+def test_diff_of_identical_frames_is_none():
+    frame = _frame()
+
+    assert diff_frames(frame, frame.copy()) is None
+
+
+def test_missing_values_compare_equal():
+    before = _frame()
+    after = before.astype({"coordinator_name": object})
+
+    assert diff_frames(before, after) is None
+
+
+def test_cell_edit_round_trips():
+    before = _frame()
+    after = before.astype({"coordinator_name": object})
+    after.loc[2, "coordinator_name"] = "Bob Jones"
+
+    edit = diff_frames(before, after, "Name")
+
+    assert {column: list(labels) for column, (labels, _) in edit.cells.items()} == {"coordinator_name": [2]}
+    _assert_same_data(apply_edit(before, edit), after)
+
+
+def test_new_categorical_value_is_added_as_a_category():
+    before = _frame()
+    after = before.astype({"park_name": object})
+    after.loc[3, "park_name"] = "Unicoi State Park"
+
+    result = apply_edit(before, diff_frames(before, after))
+
+    assert isinstance(result["park_name"].dtype, pd.CategoricalDtype)
+    assert result["park_name"].tolist() == ["Vogel State Park", "Hart State Park", "Unicoi State Park"]
+
+
+def test_added_and_dropped_rows_round_trip():
+    before = _frame()
+    added = pd.DataFrame(
+        {"park_name": ["Unicoi State Park"], "coordinator_name": ["Pat Moore"], "meeting_time": ["1:00 PM"]},
+        index=pd.Index([4], name=ROW_ID),
+    )
+    after = pd.concat([before.drop(index=2), added])
+
+    edit = diff_frames(before, after)
+    result = apply_edit(before, edit)
+
+    assert edit.dropped_rows == [2]
+    assert list(edit.added_rows.index) == [4]
+    assert result.index.tolist() == [1, 3, 4]
+    _assert_same_data(result, after)
+
+
+def test_new_column_round_trips():
+    before = _frame()
+    after = before.assign(park_zip=["30572", None, "30572"])
+
+    result = apply_edit(before, diff_frames(before, after))
+
+    assert list(result.columns) == [*before.columns, "park_zip"]
+    _assert_same_data(result, after)
+
+
+def test_apply_edit_leaves_the_input_frame_untouched():
+    before = _frame()
+    original = before.copy()
+    after = before.astype({"meeting_time": object})
+    after.loc[1, "meeting_time"] = "8:00 AM"
+
+    apply_edit(before, diff_frames(before, after))
+
+    _assert_same_data(before, original)
+
+
+def test_undo_and_redo_restore_each_version():
+    sheet = EventSheet(_frame())
+    edited = sheet.working_copy()
+    edited.loc[1, "meeting_time"] = "8:00 AM"
+    assert sheet.edit(edited, "Time")
+    edited_view = sheet.view
+    assert not sheet.edit(sheet.working_copy(), "No change")
+
+    sheet.undo()
+    assert sheet.version == 2
+    assert not sheet.can_undo and sheet.can_redo
+    _assert_same_data(sheet.view, _frame())
+
+    sheet.redo()
+    assert sheet.version == 3
+    _assert_same_data(sheet.view, edited_view)
+
+
+def test_new_edit_clears_redo():
+    sheet = EventSheet(_frame())
+    edited = sheet.working_copy()
+    edited.loc[1, "meeting_time"] = "8:00 AM"
+    sheet.edit(edited, "Time")
+    sheet.undo()
+
+    edited = sheet.working_copy()
+    edited.loc[2, "meeting_time"] = "8:30 AM"
+    sheet.edit(edited, "Other time")
+
+    assert not sheet.can_redo
+
+
+def test_issues_are_recomputed_per_version():
+    sheet = EventSheet(_frame())
+    issues = sheet.issues
+    assert sheet.issues is issues
+
+    edited = sheet.working_copy()
+    edited.loc[2, "coordinator_name"] = "Bob Jones"
+    sheet.edit(edited, "Name")
+
+    assert sheet.issues is not issues
+    assert not sheet.issues.loc[2, "missing_coordinator_name"]
+
+
+def test_edit_rows_diffs_only_the_given_rows():
+    sheet = EventSheet(_frame())
+    before = sheet.view.loc[[2]]
+    after = before.astype({"coordinator_name": object})
+    after.loc[2, "coordinator_name"] = "Bob Jones"
+
+    assert sheet.edit_rows(before, after, "Page")
+    assert sheet.view.loc[2, "coordinator_name"] == "Bob Jones"
+    assert sheet.view.index.tolist() == [1, 2, 3]
+
+
+def test_edit_rows_gives_added_rows_fresh_row_ids():
+    sheet = EventSheet(_frame())
+    page = sheet.view.loc[[3]]
+    # Delete the last row, then add one: its ID must not come back
+    sheet.edit_rows(page, page.drop(index=3), "Delete")
+
+    page = sheet.view.loc[[1]]
+    # The data editor labels a new row after the page's own labels, which clashes with row 2
+    added = page.rename(index={1: 2})
+    sheet.edit_rows(page, pd.concat([page, added]), "Add")
+
+    assert sheet.view.index.tolist() == [1, 2, 4]
+    assert sheet.view.loc[2, "park_name"] == "Hart State Park"
+    assert sheet.view.loc[4, "coordinator_name"] == "Jane Smith"
+    assert sheet.next_row_id == 5
+
+
+def test_row_ids_are_not_reused_after_undo():
+    sheet = EventSheet(_frame())
+    page = sheet.view.loc[[1]]
+    sheet.edit_rows(page, pd.concat([page, page.rename(index={1: 0})]), "Add")
+    sheet.undo()
+
+    page = sheet.view.loc[[1]]
+    sheet.edit_rows(page, pd.concat([page, page.rename(index={1: 0})]), "Add again")
+
+    assert sheet.view.index.tolist() == [1, 2, 3, 5]
@@ -0,0 +1,74 @@
+"""Tests for merging an updated event spreadsheet into a cleaned session."""
+import pandas as pd
+
+from data_loading import read_events_csv
+from session_data import EventSheet
+from sheet_merge import merge_upload
+
+
+def _upload(rows):
+    return read_events_csv(pd.DataFrame(rows, columns=[
+        "Chapter/Park Name", "Volunteer Coordinator Email", "Meeting Time",
+    ]).to_csv(index=False).encode())
+
+
+def _merge(sheet, rows):
+    merged, new_base, diff = merge_upload(sheet.original, sheet.view, _upload(rows), next_row_id=sheet.next_row_id)
+    merged_sheet = EventSheet(new_base, next_row_id=sheet.next_row_id)
+    merged_sheet.edit(merged, "Merge updated spreadsheet")
+    return merged_sheet, diff
+
+
+ROWS = [
+    ["Vogel State Park", "jane@gmail.com", "9:00 AM"],
+    ["Hart State Park", "bob@yahoo.com", "9:00 AM"],
+    ["Unicoi State Park", "li@aol.com", "10:00 AM"],
+]
+
+
+def _sheet_with_edits():
+    sheet = EventSheet(_upload(ROWS))
+    edited = sheet.working_copy()
+    edited.loc[1, "meeting_time"] = "8:30 AM"
+    sheet.edit(edited.drop(index=2), "Cleanup")
+    return sheet
+
+
+def test_merge_keeps_hand_edits_and_deletions():
+    sheet = _sheet_with_edits()
+    rows = [list(row) for row in ROWS]
+    rows[2][2] = "11:00 AM"
+
+    merged, diff = _merge(sheet, rows)
+
+    assert merged.view.index.tolist() == [1, 3]
+    assert merged.view.loc[1, "meeting_time"] == "8:30 AM"
+    assert merged.view.loc[3, "meeting_time"] == "11:00 AM"
+    assert (diff.added, diff.changed, diff.removed) == (0, 1, 0)
+
+
+def test_rows_deleted_by_hand_stay_deleted_across_merges():
+    sheet = _sheet_with_edits()
+    second = [list(row) for row in ROWS]
+    second[2][2] = "11:00 AM"
+    third = [list(row) for row in second]
+    third[0][2] = "7:00 AM"
+
+    sheet, _ = _merge(sheet, second)
+    sheet, diff = _merge(sheet, third)
+
+    assert sheet.view["park_name"].tolist() == ["Vogel State Park", "Unicoi State Park"]
+    assert sheet.view.index.tolist() == [1, 3]
+    assert diff.added == 0
+    # The file's new time wins over the hand edit
+    assert sheet.view.loc[1, "meeting_time"] == "7:00 AM"
+
+
+def test_added_rows_get_new_row_ids():
+    sheet = _sheet_with_edits()
+
+    merged, diff = _merge(sheet, [*ROWS, ["Vogel State Park", "pat@gmail.com", "1:00 PM"]])
+
+    assert diff.added == 1
+    assert merged.view.index.tolist() == [1, 3, 4]
+    assert merged.view.loc[4, "coordinator_email"] == "pat@gmail.com"
@@ -0,0 +1,55 @@
+"""Tests for the vectorized row checks."""
+import pandas as pd
+
+from data_loading import TEXT_DTYPE
+from validation import ISSUE_LABELS, critical_rows, suggest_email_fixes, validate
+
+
+def _frame():
+    return pd.DataFrame({
+        "coordinator_name": ["Jane Smith", None, "Li Lee", "Pat Moore"],
+        "coordinator_email": ["jane@gmail.com", "bob@yahoo.com", "li@gmial.com", "not an email"],
+        "coordinator_phone": ["(404) 555-0101", "555-0102", None, "404.555.0104"],
+        "park_name": pd.Series(["Vogel State Park", "Hart State Park", " ", "Vogel State Park"], dtype="category"),
+        "project_description": ["Trail work", "Litter", "Planting", "Painting"],
+        "meeting_location": ["Visitor Center", "Lot A", "Kiosk", "Shelter 1"],
+        "meeting_time": ["9:00 AM", "9 am", "noon", "sometime"],
+        "park_zip": ["30572", "30643", None, "3057"],
+    }, dtype=TEXT_DTYPE).astype({"park_name": "category"})
+
+
+def test_issue_matrix_has_one_column_per_issue():
+    issues = validate(_frame())
+
+    assert sorted(issues.columns) == sorted(ISSUE_LABELS)
+    assert issues.dtypes.eq(bool).all()
+
+
+def test_blank_and_malformed_values_are_flagged():
+    issues = validate(_frame())
+
+    assert issues["missing_coordinator_name"].tolist() == [False, True, False, False]
+    assert issues["missing_park_name"].tolist() == [False, False, True, False]
+    assert issues["bad_phone"].tolist() == [False, True, False, False]
+    assert issues["bad_email"].tolist() == [False, False, False, True]
+    assert issues["bad_zip"].tolist() == [False, False, False, True]
+    assert issues["bad_meeting_time"].tolist() == [False, False, False, True]
+
+
+def test_absent_fields_count_as_missing():
+    issues = validate(_frame().drop(columns=["park_zip"]))
+
+    assert issues["missing_park_zip"].all()
+    assert not issues["bad_zip"].any()
+
+
+def test_common_domain_typos_are_flagged_and_corrected():
+    frame = _frame()
+
+    assert validate(frame)["email_domain_typo"].tolist() == [False, False, True, False]
+    assert suggest_email_fixes(frame["coordinator_email"]).iloc[2] == "li@gmail.com"
+    assert suggest_email_fixes(frame["coordinator_email"]).iloc[[0, 1, 3]].isna().all()
+
+
+def test_critical_rows():
+    assert critical_rows(validate(_frame())).tolist() == [False, True, True, True]
@@ -0,0 +1,180 @@
+"""Row-level checks for the event sheet, computed for every row in one vectorized pass.
+
+validate() returns an issue matrix: a boolean DataFrame with one row per event
+and one column per issue, True where the event has that problem. The Preview,
+Data Cleanup and Critical Issues views all read from the same matrix, which
+EventSheet caches per version.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from column_schema import FIELDS
+from data_loading import TEXT_DTYPE
+
+# Fields the templates cannot do without; rows missing any of them are critical
+CRITICAL_FIELDS = ["coordinator_email", "coordinator_name", "park_name", "project_description"]
+
+# Columns the sheet must have, checked on the Preview page
+REQUIRED_FIELDS = [*CRITICAL_FIELDS, "meeting_location", "meeting_time"]
+
+# Fields checked for blank values
+CHECKED_FIELDS = [*REQUIRED_FIELDS, "coordinator_phone", "park_zip"]
+
+# Full-match patterns for well-formed values. Emails follow a lite RFC 5322: dot-separated atoms
+# before the @, dot-separated hostname labels and an alphabetic top-level domain after it
+_EMAIL_ATOM = r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+"
+EMAIL_REGEX = re.compile(
+    rf"\s*{_EMAIL_ATOM}(?:\.{_EMAIL_ATOM})*@(?:[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?\.)+[A-Za-z]{{2,}}\s*"
+)
+# Ten digits, optionally preceded by a US country code of 1, with any separators
+PHONE_PATTERN = r"\D*(?:1\D*)?(?:\d\D*){10}"
+ZIP_PATTERN = r"\s*\d{5}(?:-\d{4})?\s*"
+# 9 AM, 9:30 am, 10:00 A.M., 13:30, noon
+TIME_PATTERN = r"(?i)\s*(?:(?:1[0-2]|0?[1-9])(?::[0-5]\d)?\s*[ap]\.?\s*m\.?|(?:[01]?\d|2[0-3]):[0-5]\d|noon|midnight)\s*"
+
+# Email providers volunteers commonly use. A domain one typo away from one of these, or from a
+# domain used TYPO_RATIO times as often in the sheet, is flagged as a likely typo (gmial.com)
+COMMON_EMAIL_DOMAINS = [
+    "gmail.com", "yahoo.com", "outlook.com", "hotmail.com", "aol.com", "icloud.com",
+    "comcast.net", "bellsouth.net", "att.net", "msn.com", "live.com", "dnr.ga.gov",
+]
+TYPO_RATIO = 5
+
+# Issue column -> (field checked, pattern its non-blank values must match)
+FORMAT_CHECKS = {
+    "bad_email": ("coordinator_email", EMAIL_REGEX),
+    "bad_phone": ("coordinator_phone", PHONE_PATTERN),
+    "bad_zip": ("park_zip", ZIP_PATTERN),
+    "bad_meeting_time": ("meeting_time", TIME_PATTERN),
+    "bad_end_time": ("end_time", TIME_PATTERN),
+}
+
+# Issue column -> short description, for summaries and the per-row issue list
+ISSUE_LABELS = {
+    **{f"missing_{field}": f"Missing {FIELDS[field].label.lower()}" for field in CHECKED_FIELDS},
+    "bad_email": "Malformed email",
+    "email_domain_typo": "Possible email domain typo",
+    "bad_phone": "Malformed phone",
+    "bad_zip": "Bad zip code",
+    "bad_meeting_time": "Unreadable meeting time",
+    "bad_end_time": "Unreadable end time",
+}
+
+
+def _matches(values, pattern):
+    """Boolean array, True where a value fully matches pattern; categoricals are checked once per category."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        per_category = _matches(pd.Series(values.cat.categories), pattern)
+        codes = values.cat.codes.to_numpy()
+        return np.where(codes >= 0, per_category[codes], False)
+    if values.dtype != object and not pd.api.types.is_string_dtype(values):
+        values = values.astype(TEXT_DTYPE)
+    return values.str.fullmatch(pattern, na=False).to_numpy(dtype=bool)
+
+
+def _blank(values):
+    return values.isna().to_numpy() | _matches(values, r"\s*")
+
+
+def _edit_distance(a, b):
+    """Optimal string alignment distance: insertions, deletions, substitutions and adjacent swaps."""
+    previous, current = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous, current = previous, current, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+    return current[-1]
+
+
+def email_domains(emails):
+    """Lowercase domain of each address in a Series, NaN where there is none; parsed once per distinct address."""
+    codes, uniques = pd.factorize(emails)
+    domains = pd.Series(uniques, dtype=TEXT_DTYPE).str.strip().str.lower().str.extract(r"@([^@\s]+)$", expand=False)
+    return pd.Series(domains.reindex(codes).to_numpy(), index=emails.index, dtype=TEXT_DTYPE)
+
+
+def _domain_typos(domains):
+    # Compare each distinct domain with the common providers and the sheet's frequent domains
+    counts = domains.value_counts()
+    references = list(dict.fromkeys([*COMMON_EMAIL_DOMAINS, *counts.index[counts >= TYPO_RATIO]]))
+    typos = {}
+    for domain, count in counts.items():
+        if domain in COMMON_EMAIL_DOMAINS:
+            continue
+        for reference in references:
+            if reference == domain or abs(len(reference) - len(domain)) > 1:
+                continue
+            if reference not in COMMON_EMAIL_DOMAINS and counts.get(reference, 0) < TYPO_RATIO * count:
+                continue
+            if _edit_distance(domain, reference) == 1:
+                typos[domain] = reference
+                break
+    return typos
+
+
+def domain_report(emails):
+    """Frequency table of the email domains in a Series: domain, events, and the likely intended domain for typos."""
+    domains = email_domains(emails)
+    counts = domains.value_counts()
+    return pd.DataFrame({
+        "domain": counts.index,
+        "events": counts.to_numpy(),
+        "suggestion": counts.index.map(_domain_typos(domains)),
+    })
+
+
+def suggest_email_fixes(emails):
+    """Each address with a likely mistyped domain corrected (jane@gmial.com -> jane@gmail.com), NaN elsewhere."""
+    domains = email_domains(emails)
+    suggested = domains.map(_domain_typos(domains)).astype(TEXT_DTYPE)
+    flagged = suggested.notna()
+    fixed = emails[flagged].astype(TEXT_DTYPE).str.strip().str.replace(r"@[^@]*$", "@", regex=True) + suggested[flagged]
+    return fixed.reindex(emails.index)
+
+
+def validate(df):
+    """Issue matrix for df: one boolean column per entry in ISSUE_LABELS, indexed like df.
+
+    Fields absent from df count as missing on every row. Format checks only
+    flag non-blank values, so a blank email is "missing", not "malformed".
+    """
+    issues = {}
+    blanks = {}
+    for field in CHECKED_FIELDS:
+        blanks[field] = _blank(df[field]) if field in df.columns else np.ones(len(df), dtype=bool)
+        issues[f"missing_{field}"] = blanks[field]
+    for issue, (field, pattern) in FORMAT_CHECKS.items():
+        if field not in df.columns:
+            issues[issue] = np.zeros(len(df), dtype=bool)
+            continue
+        blank = blanks[field] if field in blanks else _blank(df[field])
+        issues[issue] = ~blank & ~_matches(df[field], pattern)
+    if "coordinator_email" in df.columns:
+        domains = email_domains(df["coordinator_email"])
+        issues["email_domain_typo"] = domains.isin(_domain_typos(domains)).to_numpy()
+    else:
+        issues["email_domain_typo"] = np.zeros(len(df), dtype=bool)
+    return pd.DataFrame(issues, index=df.index)
+
+
+def critical_rows(issues):
+    """Boolean Series, True for rows missing any of CRITICAL_FIELDS or with a malformed or likely mistyped email."""
+    return issues[[*(f"missing_{field}" for field in CRITICAL_FIELDS), "bad_email", "email_domain_typo"]].any(axis=1)
+
+
+def issue_summary(issues):
+    """Number of rows with each issue, for issues that occur, labelled for display."""
+    counts = issues.sum()
+    counts = counts[counts > 0]
+    return pd.DataFrame({"Issue": counts.index.map(ISSUE_LABELS), "Events": counts.to_numpy()})
+
+
+def describe_issues(issues):
+    """Comma-separated issue descriptions per row, empty for rows without issues."""
+    flagged = issues.to_numpy()
+    labels = np.array([ISSUE_LABELS[column] for column in issues.columns], dtype=object)
+    return pd.Series([", ".join(labels[row]) for row in flagged], index=issues.index, dtype=object)
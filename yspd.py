@@ -0,0 +1,127 @@
+"""Headless YSPD template generator.
+
+Usage:
+
+    python -m yspd generate input.csv --templates all --out templates/
+    python -m yspd generate input.csv --templates 14_day_reminder,3_day_reminder --out reminders.zip
+
+Writes one HTML file per event and template into a directory, or streams them
+straight into a ZIP archive when --out ends in .zip. Does not import Streamlit.
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+from batch_render import TEMPLATES, iter_rendered, template_filename
+from data_loading import read_events_csv
+from event_records import build_records
+from park_locations import canonical_park_names
+from zip_export import write_zip
+
+
+def parse_templates(value):
+    """Turn "all" or a comma-separated list of template keys into a list of keys."""
+    if value == "all":
+        return list(TEMPLATES)
+    templates = [key.strip() for key in value.split(",") if key.strip()]
+    unknown = [key for key in templates if key not in TEMPLATES]
+    if unknown or not templates:
+        raise argparse.ArgumentTypeError(
+            f"unknown template(s): {', '.join(unknown) or value!r}; choose from: all, {', '.join(TEMPLATES)}"
+        )
+    return templates
+
+
+def iter_files(df, templates, workers=1):
+    """Yield (filename, html) for every event in df and every template, in row order."""
+    records = build_records(df)
+    row_ids = df.index.tolist()
+    for position, template, html_content in iter_rendered(records, templates, workers=workers):
+        # The record's park name is stripped and "" when the cell is blank
+        yield template_filename(records[position].park_name, template, row_ids[position]), html_content
+
+
+def write_directory(files, out_dir):
+    """Write (filename, html) pairs into out_dir. Returns the number of files written."""
+    os.makedirs(out_dir, exist_ok=True)
+    written = 0
+    for filename, content in files:
+        if not content.strip():
+            continue
+        with open(os.path.join(out_dir, filename), "w", encoding="utf-8") as f:
+            f.write(content)
+        written += 1
+    return written
+
+
+def generate(args):
+    start = time.perf_counter()
+    with args.input as f:
+        df = read_events_csv(f.read())
+
+    if args.parks:
+        # Match spelling variants ("FDR State Park") through the park directory, as the app does
+        parks = canonical_park_names(pd.Series([park.strip() for park in args.parks.split(",")], dtype=object))
+        df = df[canonical_park_names(df["park_name"]).isin(parks).to_numpy()]
+
+    files = iter_files(df, args.templates, workers=args.workers)
+    if args.out.lower().endswith(".zip"):
+        out_dir = os.path.dirname(args.out)
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+        with open(args.out, "wb") as f:
+            written = write_zip(files, f)
+    else:
+        written = write_directory(files, args.out)
+
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {written} files for {len(df)} events to {args.out} in {elapsed:.2f}s")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="yspd", description="YSPD event template generator")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = subparsers.add_parser("generate", help="Render templates for every event in a CSV")
+    generate_parser.add_argument("input", type=argparse.FileType("rb"), help="Event spreadsheet exported as CSV")
+    generate_parser.add_argument(
+        "--templates",
+        type=parse_templates,
+        default="all",
+        help=f"'all' or a comma-separated list of: {', '.join(TEMPLATES)} (default: all)",
+    )
+    generate_parser.add_argument(
+        "--out",
+        required=True,
+        help="Output directory, or a path ending in .zip to write a single archive",
+    )
+    generate_parser.add_argument("--parks", help="Only generate for these comma-separated park names")
+    generate_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Render with this many processes (0 = all cores; small inputs always run serially)",
+    )
+    generate_parser.set_defaults(func=generate)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "workers", 1) == 0:
+        args.workers = None
+    try:
+        return args.func(args)
+    except OSError as e:
+        # e.g. an output directory that cannot be created; report it without a traceback for cron runs
+        print(f"{parser.prog}: error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
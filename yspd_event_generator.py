@@ -1,16 +1,26 @@
 import streamlit as st
-import pandas as pd
-import io
-import zipfile
+import numpy as np
+import os
 from datetime import datetime
+from functools import partial
 
 # Import template functions from separate files
-from template_confirmation import generate_registration_confirmation
-from template_14_day import generate_14_day_template
-from template_3_day import generate_3_day_template
-from template_day_before import generate_day_before_template
-from template_event_display import generate_event_display
+from batch_render import PARALLEL_MIN_EVENTS, TEMPLATE_LABELS, template_filename
+from cleanup import TEXT_COLUMNS, clean_text_columns, format_phone_numbers
+from column_schema import FIELDS, column_labels
+from data_loading import content_hash, decode_categories, memory_report, read_events_csv
+from event_navigation import search_events
+from event_records import build_records
+from park_locations import canonical_park_names, fill_park_zips, lookup_park_zips, park_review_list
+from render_cache import RenderCache
+from session_data import EventSheet
+from sheet_export import EXPORT_FORMATS
+from sheet_merge import merge_upload
+from validation import (
+    ISSUE_LABELS, REQUIRED_FIELDS, critical_rows, describe_issues, domain_report, issue_summary, suggest_email_fixes
+)
 from utils import safe_get
+from zip_export import spooled_zip
 
 # Page config
 st.set_page_config(
@@ -23,6 +33,181 @@ st.set_page_config(
 st.title("🌲 YSPD Event Generator")
 st.markdown("Upload your volunteer event spreadsheet and generate email templates for all parks!")
 
+@st.cache_data(show_spinner="Reading spreadsheet...", max_entries=8)
+def load_events_csv(file_hash, _data):
+    """Parse an uploaded CSV once per distinct file content (the bytes are keyed by file_hash)."""
+    return read_events_csv(_data)
+
+# Number of generated files listed per preview page
+PREVIEW_PAGE_SIZE = 10
+
+# Fields the Single Event Editor can change, in the order of its inputs
+EDITABLE_FIELDS = [
+    "coordinator_name", "coordinator_email", "coordinator_phone", "park_zip", "park_name",
+    "meeting_location", "meeting_time", "project_description", "what_to_bring", "special_instructions",
+]
+
+# Navigation widgets move st.session_state.current_event_idx in callbacks, which run before the fragment reruns
+def _step_event(step, positions):
+    # Previous or next of positions, the events matching the search, counting from the current event
+    current = st.session_state.current_event_idx
+    if step > 0:
+        i = np.searchsorted(positions, current, side="right")
+    else:
+        i = np.searchsorted(positions, current, side="left") - 1
+    if 0 <= i < len(positions):
+        st.session_state.current_event_idx = int(positions[i])
+
+def _jump_to_event(idx):
+    st.session_state.current_event_idx = int(idx)
+
+def _select_event():
+    st.session_state.current_event_idx = st.session_state.event_select
+
+def _search_events(sheet):
+    # Go to the first event matching the new search
+    positions = search_events(sheet.event_index, st.session_state.event_search)
+    if len(positions):
+        st.session_state.current_event_idx = int(positions[0])
+
+@st.fragment
+def single_event_editor(sheet):
+    """The Single Event Editor panel. Navigating and saving rerun only this fragment, not the whole page."""
+    st.write("**Review and edit events one at a time**")
+    
+    # Read the sheet afresh on every fragment run - a save here does not rerun the rest of the page
+    df_view = sheet.view
+    total_events = len(df_view)
+    
+    if 'current_event_idx' not in st.session_state:
+        st.session_state.current_event_idx = 0
+    st.session_state.current_event_idx = min(st.session_state.current_event_idx, total_events - 1)
+    
+    # Event labels and the park lookup are built once per sheet version, not on every rerun
+    event_index = sheet.event_index
+    search = st.text_input(
+        "🔍 Search events",
+        key="event_search",
+        placeholder="Park name or event number",
+        on_change=_search_events,
+        args=(sheet,),
+    )
+    positions = search_events(event_index, search)
+    if len(positions) == 0:
+        st.info(f"No events match '{search}' - showing all events.")
+        positions = np.arange(total_events)
+    elif search.strip():
+        st.caption(f"{len(positions)} of {total_events} events match")
+    
+    col1, col2, col3, col4, col5 = st.columns([1, 1, 2, 1, 1])
+    
+    with col1:
+        st.button("⬅️ Previous", on_click=_step_event, args=(-1, positions))
+    
+    with col2:
+        st.button("➡️ Next", on_click=_step_event, args=(1, positions))
+    
+    with col3:
+        # The selectbox lists the matching events and follows the current one, and picking one needs no extra rerun
+        st.session_state.event_select = st.session_state.current_event_idx
+        st.selectbox(
+            f"Event (of {total_events})",
+            np.union1d(positions, [st.session_state.current_event_idx]).tolist(),
+            format_func=event_index.labels.__getitem__,
+            key="event_select",
+            on_change=_select_event,
+        )
+    
+    with col4:
+        st.button("⏮️ First", on_click=_jump_to_event, args=(positions[0],))
+    
+    with col5:
+        st.button("⏭️ Last", on_click=_jump_to_event, args=(positions[-1],))
+    
+    # Current event data - navigation is by position, reading and saving by row ID
+    row_id = event_index.row_ids[st.session_state.current_event_idx]
+    current_event = df_view.loc[row_id]
+    
+    st.markdown("---")
+    st.subheader(f"Event {row_id}: {current_event['park_name']}")
+    
+    # Editable fields, blank where the cell is missing
+    shown = {field: safe_get(current_event, field) for field in EDITABLE_FIELDS}
+    col_left, col_right = st.columns(2)
+    
+    with col_left:
+        st.write("**Contact Information**")
+        new_coordinator = st.text_input("Coordinator Name", value=shown["coordinator_name"])
+        new_email = st.text_input("Coordinator Email", value=shown["coordinator_email"])
+        new_phone = st.text_input("Coordinator Phone", value=shown["coordinator_phone"])
+        
+        # Add zip code field (the column is created when a zip code is saved)
+        new_zip = st.text_input("Park Zip Code", value=shown["park_zip"], max_chars=5)
+    
+    with col_right:
+        st.write("**Event Details**")
+        new_park_name = st.text_input("Park Name", value=shown["park_name"])
+        new_meeting_location = st.text_area("Meeting Location", value=shown["meeting_location"])
+        new_meeting_time = st.text_input("Meeting Time", value=shown["meeting_time"])
+    
+    st.write("**Project Description**")
+    new_project = st.text_area(
+        "Project Description", 
+        value=shown["project_description"],
+        height=100
+    )
+    
+    col_bring, col_instructions = st.columns(2)
+    
+    with col_bring:
+        st.write("**What to Bring**")
+        new_bring = st.text_area(
+            "Items to bring", 
+            value=shown["what_to_bring"],
+            height=80
+        )
+    
+    with col_instructions:
+        st.write("**Special Instructions**")
+        new_instructions = st.text_area(
+            "Special instructions", 
+            value=shown["special_instructions"],
+            height=80
+        )
+    
+    # Save changes button
+    if st.button("💾 Save Changes to This Event", type="primary"):
+        # Only this event's row is copied and compared, so a save costs one row whatever the sheet size
+        event_row = df_view.loc[[row_id]]
+        edited_row = decode_categories(event_row)
+        entered = dict(zip(EDITABLE_FIELDS, [
+            new_coordinator, new_email, new_phone, new_zip, new_park_name,
+            new_meeting_location, new_meeting_time, new_project, new_bring, new_instructions,
+        ]))
+        # Only fields changed in the form are written, so untouched blank cells stay missing
+        for field, value in entered.items():
+            if value != shown[field]:
+                edited_row.at[row_id, field] = value
+        
+        sheet.edit_rows(event_row, edited_row, f"Edit event {row_id}")
+        st.success("✅ Event saved!")
+        st.balloons()
+
+def templates_zip(generated, render_cache):
+    """ZIP bytes of every generated template, rendered and streamed into a spooled archive when the download is clicked.
+
+    Pages already in the render cache are reused, but the cache keeps only previewed pages, not the whole archive.
+    """
+    filenames = {(position, key): filename for filename, position, key in generated["files"]}
+    rendered_files = (
+        (filenames[position, key], html_content)
+        for position, key, html_content in render_cache.iter_rendered(
+            generated["records"], generated["templates"], workers=generated["workers"], store=False
+        )
+    )
+    with spooled_zip(rendered_files) as zip_file:
+        return zip_file.read()
+
 # Sidebar for navigation
 st.sidebar.title("Navigation")
 page = st.sidebar.radio("Choose a step:", ["1. Upload Data", "2. Preview Data", "3. Data Cleanup", "4. Generate Templates"])
@@ -41,35 +226,90 @@ if page == "1. Upload Data":
         # Store in session state
         st.session_state.uploaded_file = uploaded_file
         
-        # Read and display basic info
-        df = pd.read_csv(uploaded_file)
-        st.session_state.df = df
+        # Read and display basic info - only parse when the file content changes
+        data = uploaded_file.getvalue()
+        file_hash = content_hash(data)
+        if st.session_state.get('upload_hash') != file_hash:
+            new_df = load_events_csv(file_hash, data)
+            
+            if 'sheet' in st.session_state and st.session_state.sheet.can_undo:
+                # An earlier sheet has been cleaned - offer to merge the updated one into it
+                sheet = st.session_state.sheet
+                merged_df, new_base, diff = merge_upload(sheet.original, sheet.view, new_df, next_row_id=sheet.next_row_id)
+                
+                st.subheader("Updated Spreadsheet")
+                st.write(
+                    f"Compared with your current data: **{diff.added}** added, **{diff.changed}** changed, "
+                    f"**{diff.removed}** removed and **{diff.unchanged}** unchanged events."
+                )
+                if diff.conflicts:
+                    st.warning(f"⚠️ {diff.conflicts} cells you edited during cleanup were also changed in the new file - merging keeps the new file's values.")
+                
+                col_merge, col_replace = st.columns(2)
+                with col_merge:
+                    merge_clicked = st.button("🔀 Merge Changes", type="primary", help="Apply only added, changed and removed rows and keep your cleanup edits")
+                with col_replace:
+                    replace_clicked = st.button("♻️ Replace All Data", help="Start over from the new file and discard cleanup edits")
+                
+                if merge_clicked:
+                    st.session_state.merge_diff = diff
+                    # The new file becomes the original; the kept cleanup edits are one undoable step on top
+                    st.session_state.sheet = EventSheet(new_base, next_row_id=sheet.next_row_id)
+                    st.session_state.sheet.edit(merged_df, "Merge updated spreadsheet")
+                    st.session_state.upload_hash = file_hash
+                    # Templates generated from the previous sheet no longer apply
+                    st.session_state.pop('generated', None)
+                    st.rerun()
+                elif replace_clicked:
+                    st.session_state.sheet = EventSheet(new_df)
+                    st.session_state.upload_hash = file_hash
+                    # Templates generated from the previous sheet no longer apply
+                    st.session_state.pop('generated', None)
+                    st.rerun()
+                st.stop()
+            
+            st.session_state.sheet = EventSheet(new_df)
+            st.session_state.upload_hash = file_hash
+            # Templates generated from the previous sheet no longer apply
+            st.session_state.pop('generated', None)
+        df = st.session_state.sheet.view
         
         st.success(f"✅ File uploaded successfully!")
+        if 'merge_diff' in st.session_state:
+            diff = st.session_state.pop('merge_diff')
+            # The render cache is keyed by event content, so unchanged events are not re-rendered
+            st.success(f"🔀 Merged the updated spreadsheet. Only the {diff.added + diff.changed} added or changed events need their templates regenerated.")
         st.info(f"📊 Found {len(df)} events in your spreadsheet")
         
-        # Show column names
+        # Show column names - recognized headers by their field label, anything else as it appears in the file
         st.subheader("Column Headers Found:")
+        labels = column_labels(df.columns)
         cols = st.columns(3)
         for i, col in enumerate(df.columns):
             with cols[i % 3]:
-                st.write(f"• {col}")
+                st.write(f"• {labels[col]}" if col in labels else f"• {col} *(not used)*")
+        
+        # A renamed form question would otherwise leave that field blank in every template
+        unmatched_fields = [field.header for name, field in FIELDS.items() if name not in df.columns]
+        if unmatched_fields:
+            st.warning(f"⚠️ No column matched these fields, so they will be left blank: {', '.join(unmatched_fields)}")
     
     else:
         st.info("👆 Please upload your CSV file to get started")
 
 elif page == "2. Preview Data":
-    if 'df' not in st.session_state:
+    if 'sheet' not in st.session_state:
         st.warning("⚠️ Please upload your data first!")
         st.stop()
     
     st.header("Step 2: Preview Your Data")
     
-    df = st.session_state.df
+    df = st.session_state.sheet.view
+    issues = st.session_state.sheet.issues
     
     # Show data preview
     st.subheader("Data Preview")
-    st.dataframe(df.head(), use_container_width=True)
+    st.dataframe(df.head(), use_container_width=True, column_config=column_labels(df.columns))
     
     # Show data summary
     st.subheader("Data Summary")
@@ -80,49 +320,78 @@ elif page == "2. Preview Data":
     
     with col2:
         # Count unique parks
-        park_col = "Chapter/Park Name"  # Adjust based on your actual column name
+        park_col = "park_name"
         if park_col in df.columns:
-            unique_parks = df[park_col].nunique()
+            unique_parks = canonical_park_names(df[park_col]).nunique()
             st.metric("Unique Parks", unique_parks)
     
     with col3:
         # Count missing coordinator emails
-        email_col = "Volunteer Coordinator Email"
-        if email_col in df.columns:
-            missing_emails = df[email_col].isna().sum()
-            st.metric("Missing Emails", missing_emails)
+        st.metric("Missing Emails", issues["missing_coordinator_email"].sum())
     
     # Data quality checks
     st.subheader("Data Quality Check")
     
-    required_columns = [
-        "Volunteer Coordinator Name",
-        "Volunteer Coordinator Email", 
-        "Chapter/Park Name",
-        "Describe the project(s) that are planned at your site.",
-        "Specific meeting location - e.g., Visitor Center, Group Shelter 1.",
-        "Meeting Time"
-    ]
-    
-    missing_cols = [col for col in required_columns if col not in df.columns]
+    missing_cols = [col for col in REQUIRED_FIELDS if col not in df.columns]
     
     if missing_cols:
-        st.error(f"❌ Missing required columns: {', '.join(missing_cols)}")
+        st.error(f"❌ Missing required columns: {', '.join(FIELDS[col].header for col in missing_cols)}")
     else:
         st.success("✅ All required columns found!")
+    
+    # Row-level problems from the shared issue matrix
+    summary = issue_summary(issues)
+    if len(summary) > 0:
+        st.warning(f"⚠️ {issues.any(axis=1).sum()} events have missing or malformed values:")
+        st.dataframe(summary, use_container_width=True, hide_index=True)
+    else:
+        st.success("✅ No missing or malformed values found!")
+    
+    # Domains seen in coordinator emails, with likely typos such as gmial.com flagged
+    if "coordinator_email" in df.columns:
+        domains = domain_report(df["coordinator_email"])
+        typo_domains = domains["suggestion"].notna()
+        with st.expander(f"📧 Email domains ({len(domains)} found, {typo_domains.sum()} possible typos)", expanded=bool(typo_domains.any())):
+            st.dataframe(
+                domains.rename(columns={"domain": "Domain", "events": "Events", "suggestion": "Did you mean"}),
+                use_container_width=True,
+                hide_index=True,
+            )
+    
+    # Memory report, computed only when asked for since sizing object strings scans every cell
+    if st.checkbox("🧠 Show memory usage"):
+        report = memory_report(df)
+        total, as_object = report["MB"].sum(), report["MB as object"].sum()
+        st.caption(f"This sheet uses {total:.1f} MB in memory, {as_object / total:.1f}x less than {as_object:.1f} MB as plain Python strings.")
+        st.dataframe(report.round(2), use_container_width=True)
 
 elif page == "3. Data Cleanup":
-    if 'df' not in st.session_state:
+    if 'sheet' not in st.session_state:
         st.warning("⚠️ Please upload your data first!")
         st.stop()
     
     st.header("Step 3: Clean Up Your Data")
     
-    # Make a copy of the dataframe for editing
-    if 'cleaned_df' not in st.session_state:
-        st.session_state.cleaned_df = st.session_state.df.copy()
+    # Cleanup edits are logged on top of the uploaded sheet; tools modify a working copy and save it with sheet.edit()
+    sheet = st.session_state.sheet
+    df_clean = sheet.working_copy()
+    issues = sheet.issues
     
-    df_clean = st.session_state.cleaned_df
+    col_undo, col_redo, col_history = st.columns([1, 1, 4])
+    
+    with col_undo:
+        if st.button("↩️ Undo", disabled=not sheet.can_undo):
+            sheet.undo()
+            st.rerun()
+    
+    with col_redo:
+        if st.button("↪️ Redo", disabled=not sheet.can_redo):
+            sheet.redo()
+            st.rerun()
+    
+    with col_history:
+        if sheet.can_undo:
+            st.caption(f"{len(sheet.edits)} cleanup edits - last: {sheet.edits[-1].description}")
     
     # Show current data status
     st.subheader("Data Quality Overview")
@@ -130,17 +399,17 @@ elif page == "3. Data Cleanup":
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        missing_emails = df_clean["Volunteer Coordinator Email"].isna().sum()
+        missing_emails = issues["missing_coordinator_email"].sum()
         st.metric("Missing Emails", missing_emails, delta=None if missing_emails == 0 else "⚠️")
     
     with col2:
-        missing_phones = df_clean["Volunteer Coordinator Phone"].isna().sum()
+        missing_phones = issues["missing_coordinator_phone"].sum()
         st.metric("Missing Phones", missing_phones, delta=None if missing_phones == 0 else "⚠️")
     
     with col3:
         # Check if zip code column exists
-        if "Park Zip Code" in df_clean.columns:
-            missing_zips = df_clean["Park Zip Code"].isna().sum()
+        if "park_zip" in df_clean.columns:
+            missing_zips = issues["missing_park_zip"].sum()
             st.metric("Missing Zip Codes", missing_zips, delta=None if missing_zips == 0 else "⚠️")
         else:
             st.metric("Zip Code Column", "Missing", delta="❌")
@@ -157,28 +426,41 @@ elif page == "3. Data Cleanup":
     
     if cleanup_view == "🔧 Quick Tools":
         # Original tab layout for automated cleanup
-        cleanup_tab1, cleanup_tab2, cleanup_tab3 = st.tabs(["📍 Add Zip Codes", "📞 Fix Phone Numbers", "✨ General Cleanup"])
+        cleanup_tab1, cleanup_tab2, cleanup_tab3, cleanup_tab4 = st.tabs(["📍 Add Zip Codes", "📞 Fix Phone Numbers", "✨ General Cleanup", "🏞️ Park Names"])
         
         with cleanup_tab1:
             st.write("**Add Park Zip Codes**")
             
             # Add zip code column if it doesn't exist
-            if "Park Zip Code" not in df_clean.columns:
+            if "park_zip" not in df_clean.columns:
                 if st.button("➕ Add Zip Code Column"):
-                    df_clean["Park Zip Code"] = ""
-                    st.session_state.cleaned_df = df_clean
+                    df_clean["park_zip"] = ""
+                    sheet.edit(df_clean, "Add zip code column")
                     st.success("Added 'Park Zip Code' column!")
                     st.rerun()
             
-            if "Park Zip Code" in df_clean.columns:
+            if "park_zip" in df_clean.columns:
                 # Show parks missing zip codes
-                missing_zip_parks = df_clean[df_clean["Park Zip Code"].isna() | (df_clean["Park Zip Code"] == "")]
+                missing_zip_parks = df_clean[df_clean["park_zip"].isna() | (df_clean["park_zip"] == "")]
                 
                 if len(missing_zip_parks) > 0:
-                    st.write(f"Parks missing zip codes ({len(missing_zip_parks)}):")
+                    # Parks in the bundled state park directory are filled in one lookup
+                    known = lookup_park_zips(missing_zip_parks["park_name"]).notna().to_numpy()
+                    if known.any():
+                        st.info(f"🗺️ {known.sum()} of {len(missing_zip_parks)} parks missing zip codes are in the Georgia state park directory.")
+                        if st.button("📍 Auto-fill Known Parks"):
+                            filled = fill_park_zips(df_clean)
+                            sheet.edit(df_clean, "Auto-fill zip codes")
+                            st.success(f"✅ Filled {filled} zip codes!")
+                            st.rerun()
+                    
+                    # Only parks the directory doesn't know need typing in
+                    unmatched_parks = missing_zip_parks[~known]
+                    if len(unmatched_parks) > 0:
+                        st.write(f"Parks not in the directory ({len(unmatched_parks)}):")
                     
-                    for idx, row in missing_zip_parks.iterrows():
-                        park_name = row["Chapter/Park Name"]
+                    for idx, row in unmatched_parks.iterrows():
+                        park_name = row["park_name"]
                         
                         col_park, col_zip = st.columns([3, 1])
                         
@@ -193,8 +475,8 @@ elif page == "3. Data Cleanup":
                                 placeholder="30309"
                             )
                             if zip_code and len(zip_code) == 5:
-                                df_clean.at[idx, "Park Zip Code"] = zip_code
-                                st.session_state.cleaned_df = df_clean
+                                df_clean.at[idx, "park_zip"] = zip_code
+                                sheet.edit(df_clean, f"Zip code for {park_name}")
                 else:
                     st.success("✅ All parks have zip codes!")
         
@@ -202,7 +484,7 @@ elif page == "3. Data Cleanup":
             st.write("**Standardize Phone Numbers**")
             
             # Show current phone format issues
-            phone_col = "Volunteer Coordinator Phone"
+            phone_col = "coordinator_phone"
             if phone_col in df_clean.columns:
                 # Count different phone formats
                 phone_samples = df_clean[phone_col].dropna().head(5).tolist()
@@ -213,225 +495,162 @@ elif page == "3. Data Cleanup":
                         st.code(str(phone))
                     
                     if st.button("🔧 Auto-format Phone Numbers"):
-                        # Simple phone number cleaning
-                        def clean_phone(phone):
-                            if pd.isna(phone):
-                                return phone
-                            
-                            # Remove all non-digits
-                            digits = ''.join(filter(str.isdigit, str(phone)))
-                            
-                            # If 10 digits, format as (XXX) XXX-XXXX
-                            if len(digits) == 10:
-                                return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-                            # If 11 digits and starts with 1, remove the 1
-                            elif len(digits) == 11 and digits.startswith('1'):
-                                digits = digits[1:]
-                                return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-                            else:
-                                return phone  # Return original if can't format
-                        
-                        df_clean[phone_col] = df_clean[phone_col].apply(clean_phone)
-                        st.session_state.cleaned_df = df_clean
+                        formatted_phones, unformatted_phones = format_phone_numbers(df_clean[phone_col])
+                        df_clean[phone_col] = formatted_phones
+                        sheet.edit(df_clean, "Format phone numbers")
+                        st.session_state.unformatted_phones = unformatted_phones
                         st.success("✅ Phone numbers formatted!")
                         st.rerun()
+                
+                # Report numbers the formatter could not turn into (XXX) XXX-XXXX
+                unformatted_phones = st.session_state.get('unformatted_phones')
+                if unformatted_phones is not None and len(unformatted_phones) > 0:
+                    st.warning(f"⚠️ {len(unformatted_phones)} phone numbers could not be formatted and were left as-is:")
+                    st.dataframe(
+                        df_clean.loc[df_clean.index.intersection(unformatted_phones.index), ["park_name", phone_col]],
+                        use_container_width=True,
+                        column_config=column_labels(["park_name", phone_col])
+                    )
         
         with cleanup_tab3:
             st.write("**General Text Cleanup**")
             
             if st.button("🧹 Clean Text Fields"):
-                text_columns = [
-                    "Volunteer Coordinator Name",
-                    "Chapter/Park Name", 
-                    "Describe the project(s) that are planned at your site.",
-                    "Specific meeting location - e.g., Visitor Center, Group Shelter 1."
-                ]
+                # Strip and collapse whitespace runs; blanks stay missing instead of becoming 'nan'
+                changed = clean_text_columns(df_clean, TEXT_COLUMNS)
                 
-                for col in text_columns:
-                    if col in df_clean.columns:
-                        # Strip whitespace and fix common issues
-                        df_clean[col] = df_clean[col].astype(str).str.strip()
-                        df_clean[col] = df_clean[col].str.replace('  ', ' ')  # Double spaces
-                        df_clean[col] = df_clean[col].replace('nan', '')  # Remove 'nan' strings
-                
-                st.session_state.cleaned_df = df_clean
-                st.success("✅ Text fields cleaned!")
+                sheet.edit(df_clean, "Clean text fields")
+                st.success(f"✅ Text fields cleaned! {changed} values tidied")
+        
+        with cleanup_tab4:
+            st.write("**Match Park Names to the State Park Directory**")
+            
+            park_names = df_clean["park_name"]
+            canonical_names = canonical_park_names(park_names)
+            renames = (park_names != canonical_names) & canonical_names.notna()
+            
+            if renames.any():
+                st.info(f"🏞️ {renames.sum()} events have park names that can be standardized.")
+                if st.button("✨ Standardize Park Names"):
+                    df_clean.loc[renames, "park_name"] = canonical_names[renames].to_numpy()
+                    sheet.edit(df_clean, "Standardize park names")
+                    st.success(f"✅ Renamed {renames.sum()} park names!")
+                    st.rerun()
+            
+            # Names that didn't match confidently are left for a human to check
+            review = park_review_list(park_names)
+            if len(review) > 0:
+                st.warning(f"⚠️ {len(review)} park names need review:")
+                st.dataframe(
+                    review.rename(columns={"name": "Name in sheet", "best_match": "Best match", "score": "Confidence", "rows": "Events"}),
+                    use_container_width=True
+                )
+            else:
+                st.success("✅ All park names match the directory!")
     
     elif cleanup_view == "📋 Table Editor":
         st.write("**Edit data directly in the table below**")
         st.info("💡 Click on any cell to edit it. Changes are saved automatically.")
         
-        # Use st.data_editor for inline editing
+        # Filter and page on the server so only the visible rows are sent to the browser
+        col_park_filter, col_issue_filter, col_page_size = st.columns([2, 2, 1])
+        
+        with col_park_filter:
+            table_parks = st.multiselect("Filter by park:", sorted(df_clean["park_name"].dropna().unique()))
+        
+        with col_issue_filter:
+            table_issues = st.multiselect(
+                "Filter by issue:",
+                [issue for issue in issues.columns if issues[issue].any()],
+                format_func=ISSUE_LABELS.__getitem__,
+            )
+        
+        with col_page_size:
+            table_page_size = st.selectbox("Rows per page", [25, 50, 100, 250], index=1)
+        
+        shown = np.ones(len(df_clean), dtype=bool)
+        if table_parks:
+            shown &= df_clean["park_name"].isin(table_parks).to_numpy()
+        if table_issues:
+            shown &= issues[table_issues].any(axis=1).to_numpy()
+        shown_labels = df_clean.index[shown]
+        
+        total_table_pages = max(1, -(-len(shown_labels) // table_page_size))
+        st.session_state.table_page = min(st.session_state.get('table_page', 1), total_table_pages)
+        table_page = st.number_input(
+            f"Page (of {total_table_pages}, {len(shown_labels)} rows)",
+            min_value=1,
+            max_value=total_table_pages,
+            key="table_page",
+        )
+        page_start = (table_page - 1) * table_page_size
+        page_df = df_clean.loc[shown_labels[page_start:page_start + table_page_size]]
+        
+        # Use st.data_editor for inline editing of this page - keyed on the sheet version and the page shown,
+        # so undo/redo and paging start it afresh
+        page_key = hash((tuple(table_parks), tuple(table_issues), table_page_size, table_page))
         edited_df = st.data_editor(
-            df_clean,
+            page_df,
+            key=f"table_editor_{sheet.version}_{page_key}",
             use_container_width=True,
             num_rows="dynamic",  # Allow adding/removing rows
             column_config={
-                "Park Zip Code": st.column_config.TextColumn(
+                **column_labels(df_clean.columns),
+                "park_zip": st.column_config.TextColumn(
                     "Park Zip Code",
                     help="5-digit zip code for the park",
                     max_chars=5,
                 ),
-                "Volunteer Coordinator Phone": st.column_config.TextColumn(
+                "coordinator_phone": st.column_config.TextColumn(
                     "Phone",
                     help="Phone number in (XXX) XXX-XXXX format",
                 ),
-                "Meeting Time": st.column_config.TextColumn(
+                "meeting_time": st.column_config.TextColumn(
                     "Meeting Time",
                     help="e.g., 9:00 AM",
                 ),
             }
         )
         
-        # Update session state with edited data
-        st.session_state.cleaned_df = edited_df
-        df_clean = edited_df
+        # Log any changes made on this page as a sparse edit of just these rows
+        if sheet.edit_rows(page_df, edited_df, "Table edit"):
+            st.rerun()
     
     elif cleanup_view == "📝 Single Event Editor":
-        st.write("**Review and edit events one at a time**")
-        
-        # Event navigation
-        total_events = len(df_clean)
-        
-        if 'current_event_idx' not in st.session_state:
-            st.session_state.current_event_idx = 0
-        
-        col1, col2, col3, col4, col5 = st.columns([1, 1, 2, 1, 1])
-        
-        with col1:
-            if st.button("⬅️ Previous") and st.session_state.current_event_idx > 0:
-                st.session_state.current_event_idx -= 1
-                st.rerun()
-        
-        with col2:
-            if st.button("➡️ Next") and st.session_state.current_event_idx < total_events - 1:
-                st.session_state.current_event_idx += 1
-                st.rerun()
-        
-        with col3:
-            current_idx = st.selectbox(
-                f"Event ({st.session_state.current_event_idx + 1} of {total_events})",
-                range(total_events),
-                index=st.session_state.current_event_idx,
-                format_func=lambda x: f"{x+1}. {df_clean.iloc[x]['Chapter/Park Name']}"
-            )
-            if current_idx != st.session_state.current_event_idx:
-                st.session_state.current_event_idx = current_idx
-                st.rerun()
-        
-        with col4:
-            if st.button("⏮️ First"):
-                st.session_state.current_event_idx = 0
-                st.rerun()
-        
-        with col5:
-            if st.button("⏭️ Last"):
-                st.session_state.current_event_idx = total_events - 1
-                st.rerun()
-        
-        # Current event data
-        current_event = df_clean.iloc[st.session_state.current_event_idx]
-        
-        st.markdown("---")
-        st.subheader(f"Event {st.session_state.current_event_idx + 1}: {current_event['Chapter/Park Name']}")
-        
-        # Editable fields
-        col_left, col_right = st.columns(2)
-        
-        with col_left:
-            st.write("**Contact Information**")
-            new_coordinator = st.text_input("Coordinator Name", value=str(current_event.get("Volunteer Coordinator Name", "")))
-            new_email = st.text_input("Coordinator Email", value=str(current_event.get("Volunteer Coordinator Email", "")))
-            new_phone = st.text_input("Coordinator Phone", value=str(current_event.get("Volunteer Coordinator Phone", "")))
-            
-            # Add zip code field
-            if "Park Zip Code" not in df_clean.columns:
-                df_clean["Park Zip Code"] = ""
-                st.session_state.cleaned_df = df_clean
-            
-            new_zip = st.text_input("Park Zip Code", value=str(current_event.get("Park Zip Code", "")), max_chars=5)
-        
-        with col_right:
-            st.write("**Event Details**")
-            new_park_name = st.text_input("Park Name", value=str(current_event.get("Chapter/Park Name", "")))
-            new_meeting_location = st.text_area("Meeting Location", value=str(current_event.get("Specific meeting location - e.g., Visitor Center, Group Shelter 1.", "")))
-            new_meeting_time = st.text_input("Meeting Time", value=str(current_event.get("Meeting Time", "")))
-        
-        st.write("**Project Description**")
-        new_project = st.text_area(
-            "Project Description", 
-            value=str(current_event.get("Describe the project(s) that are planned at your site.", "")),
-            height=100
-        )
-        
-        col_bring, col_instructions = st.columns(2)
-        
-        with col_bring:
-            st.write("**What to Bring**")
-            new_bring = st.text_area(
-                "Items to bring", 
-                value=str(current_event.get("What Should A Volunteer Bring for the Day? e.g., gloves, sun screen, bug spray, etc.", "")),
-                height=80
-            )
-        
-        with col_instructions:
-            st.write("**Special Instructions**")
-            new_instructions = st.text_area(
-                "Special instructions", 
-                value=str(current_event.get("Special Instructions: e.g., closed-toe shoes, working near water, bring a change of clothes if desired, etc.", "")),
-                height=80
-            )
-        
-        # Save changes button
-        if st.button("💾 Save Changes to This Event", type="primary"):
-            idx = st.session_state.current_event_idx
-            df_clean.at[idx, "Volunteer Coordinator Name"] = new_coordinator
-            df_clean.at[idx, "Volunteer Coordinator Email"] = new_email
-            df_clean.at[idx, "Volunteer Coordinator Phone"] = new_phone
-            df_clean.at[idx, "Park Zip Code"] = new_zip
-            df_clean.at[idx, "Chapter/Park Name"] = new_park_name
-            df_clean.at[idx, "Specific meeting location - e.g., Visitor Center, Group Shelter 1."] = new_meeting_location
-            df_clean.at[idx, "Meeting Time"] = new_meeting_time
-            df_clean.at[idx, "Describe the project(s) that are planned at your site."] = new_project
-            df_clean.at[idx, "What Should A Volunteer Bring for the Day? e.g., gloves, sun screen, bug spray, etc."] = new_bring
-            df_clean.at[idx, "Special Instructions: e.g., closed-toe shoes, working near water, bring a change of clothes if desired, etc."] = new_instructions
-            
-            st.session_state.cleaned_df = df_clean
-            st.success("✅ Event saved!")
-            st.balloons()
+        single_event_editor(sheet)
     
     elif cleanup_view == "🚨 Critical Issues Only":
-        # Simplified view focusing only on critical missing data
-        st.write("**Focus on critical missing data that will break template generation**")
+        # Simplified view focusing only on critical missing data and bad coordinator emails
+        st.write("**Focus on critical missing data and coordinator emails that will break template generation**")
         
-        critical_cols = [
-            "Volunteer Coordinator Email",
-            "Volunteer Coordinator Name",
-            "Chapter/Park Name",
-            "Describe the project(s) that are planned at your site."
-        ]
-        
-        # Identify rows with any missing critical data
-        rows_with_na = df_clean[df_clean[critical_cols].isnull().any(axis=1)]
+        # Rows with any missing critical data, from the shared issue matrix
+        critical = critical_rows(issues)
+        rows_with_na = df_clean[critical]
         
         if not rows_with_na.empty:
-            st.warning(f"Found {len(rows_with_na)} rows with missing critical data. Please correct these entries below.")
+            st.warning(f"Found {len(rows_with_na)} rows with missing critical data or problem emails. Please correct these entries below.")
+            # What is wrong with each row and any corrected email, shown read-only in front of the data
+            rows_with_na.insert(0, "Issues", describe_issues(issues[critical]))
+            rows_with_na.insert(1, "Suggested email", suggest_email_fixes(df_clean["coordinator_email"])[critical])
             edited_df = st.data_editor(
                 rows_with_na, 
+                key=f"critical_editor_{sheet.version}",
                 use_container_width=True, 
                 num_rows="dynamic",
+                disabled=["Issues", "Suggested email"],
                 column_config={
-                    "Volunteer Coordinator Email": st.column_config.TextColumn(
+                    **column_labels(rows_with_na.columns),
+                    "coordinator_email": st.column_config.TextColumn(
                         "Email*",
                         help="Required for templates",
                         required=True
                     ),
-                    "Volunteer Coordinator Name": st.column_config.TextColumn(
+                    "coordinator_name": st.column_config.TextColumn(
                         "Name*", 
                         help="Required for templates",
                         required=True
                     ),
-                    "Chapter/Park Name": st.column_config.TextColumn(
+                    "park_name": st.column_config.TextColumn(
                         "Park Name*",
                         help="Required for templates", 
                         required=True
@@ -441,47 +660,56 @@ elif page == "3. Data Cleanup":
             
             # Save changes if the user edits
             if st.button("💾 Save Critical Fixes"):
-                # Update the original dataframe with the edited rows
-                st.session_state.cleaned_df.loc[edited_df.index] = edited_df
+                # Log the changes to just these rows; rows added here get new row IDs
+                sheet.edit_rows(df_clean[critical], edited_df.drop(columns=["Issues", "Suggested email"]), "Fix critical issues")
                 st.success("✅ Critical issues fixed!")
                 st.rerun()
         else:
-            st.success("🎉 No critical missing data found! Your data is ready for template generation.")
+            st.success("🎉 No critical missing data or email problems found! Your data is ready for template generation.")
     
     # Show cleaned data preview
     st.subheader("Cleaned Data Preview")
-    st.dataframe(df_clean, use_container_width=True)
+    st.dataframe(df_clean, use_container_width=True, column_config=column_labels(df_clean.columns))
     
     # Download cleaned CSV
     st.subheader("Download Cleaned Data")
     
-    csv_buffer = io.StringIO()
-    df_clean.to_csv(csv_buffer, index=False)
-    csv_data = csv_buffer.getvalue()
-    
     col1, col2 = st.columns(2)
     
     with col1:
+        export_format = st.radio(
+            "File format",
+            list(EXPORT_FORMATS),
+            format_func=lambda fmt: EXPORT_FORMATS[fmt][0],
+            horizontal=True,
+            help="CSV can be uploaded here again; gzip is smaller to share; Parquet keeps column types for analysis tools",
+        )
+        format_label, file_name, mime = EXPORT_FORMATS[export_format]
+        # The file is only built when the button is clicked, then reused until the next cleanup edit
         st.download_button(
-            label="📥 Download Cleaned CSV",
-            data=csv_data,
-            file_name="yspd_events_cleaned.csv",
-            mime="text/csv"
+            label=f"📥 Download Cleaned {format_label}",
+            data=partial(sheet.export, export_format),
+            file_name=file_name,
+            mime=mime
         )
     
     with col2:
-        if st.button("✅ Use Cleaned Data for Templates"):
-            st.session_state.df = df_clean  # Replace original with cleaned version
-            st.success("Cleaned data is now active! Go to Generate Templates.")
+        st.info("✅ Cleanup edits are used automatically when you generate templates.")
 
 elif page == "4. Generate Templates":
-    if 'df' not in st.session_state:
+    if 'sheet' not in st.session_state:
         st.warning("⚠️ Please upload your data first!")
         st.stop()
     
     st.header("Step 4: Generate Templates")
     
-    df = st.session_state.get('cleaned_df', st.session_state.df)
+    df = st.session_state.sheet.view
+    
+    # Generated templates belong to one upload and one version of its cleanup edits
+    sheet_key = (st.session_state.get('upload_hash'), st.session_state.sheet.version)
+    if 'generated' in st.session_state and st.session_state.generated["sheet_key"] != sheet_key:
+        del st.session_state.generated
+        st.info("ℹ️ Your data has changed since the templates were generated - generate them again to include the changes.")
     
     # Template selection
     st.subheader("Select Templates to Generate")
@@ -503,10 +731,20 @@ elif page == "4. Generate Templates":
     if st.checkbox("Generate for all events", value=True):
         selected_events = df.index.tolist()
     else:
-        # Multi-select for specific events
-        park_names = df["Chapter/Park Name"].tolist()
-        selected_parks = st.multiselect("Choose specific parks:", park_names)
-        selected_events = df[df["Chapter/Park Name"].isin(selected_parks)].index.tolist()
+        # Multi-select for specific events, with spelling variants grouped under the official park name
+        park_names = canonical_park_names(df["park_name"])
+        selected_parks = st.multiselect("Choose specific parks:", sorted(park_names.dropna().unique()))
+        selected_events = df[park_names.isin(selected_parks)].index.tolist()
+    
+    # Parallel rendering for large batches
+    workers = 1
+    if st.checkbox("⚡ Render in parallel", value=False, help=f"Use several CPU cores for very large sheets. Starting the workers takes a couple of seconds, so batches under {PARALLEL_MIN_EVENTS:,} events are always rendered serially."):
+        workers = st.number_input(
+            "Worker processes",
+            min_value=1,
+            max_value=os.cpu_count() or 1,
+            value=os.cpu_count() or 1,
+        )
     
     # Generate button
     if st.button("🚀 Generate Templates", type="primary"):
@@ -518,106 +756,138 @@ elif page == "4. Generate Templates":
             st.success(f"Generating templates for {len(selected_events)} events...")
             
             # Generate templates for selected events
-            generated_files = []
+            # Render each selected template for all selected events in one batch
+            template_flags = {
+                "event_display": template_event_display,
+                "registration_confirmation": template_confirmation,
+                "14_day_reminder": template_14_day,
+                "3_day_reminder": template_3_day,
+                "day_before_reminder": template_day_before,
+            }
+            selected_templates = [key for key, selected in template_flags.items() if selected]
             
-            for idx in selected_events:
-                event = df.iloc[idx]
-                park_name = event["Chapter/Park Name"]
-                
-                # Clean up park name for filename
-                safe_park_name = "".join(c for c in park_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                safe_park_name = safe_park_name.replace(' ', '_')
-                
-                if template_event_display:
-                    html_content = generate_event_display(event)
-                    filename = f"{safe_park_name}_event_display.html"
-                    generated_files.append((filename, html_content))
-                
-                if template_confirmation:
-                    html_content = generate_registration_confirmation(event)
-                    filename = f"{safe_park_name}_registration_confirmation.html"
-                    generated_files.append((filename, html_content))
-                
-                if template_14_day:
-                    html_content = generate_14_day_template(event)
-                    filename = f"{safe_park_name}_14_day_reminder.html"
-                    generated_files.append((filename, html_content))
-                
-                if template_3_day:
-                    html_content = generate_3_day_template(event)
-                    filename = f"{safe_park_name}_3_day_reminder.html"
-                    generated_files.append((filename, html_content))
-                
-                if template_day_before:
-                    html_content = generate_day_before_template(event)
-                    filename = f"{safe_park_name}_day_before_reminder.html"
-                    generated_files.append((filename, html_content))
+            # Selected events are row IDs, so look them up by label
+            selected_df = df.loc[selected_events]
+            records = build_records(selected_df)
+            # Park names come from the records, where blanks are "" and whitespace is stripped
+            park_names = [record.park_name for record in records]
+            row_ids = selected_df.index.tolist()
             
-            st.success(f"✅ Generated {len(generated_files)} template files!")
+            # Keep only (filename, event position, template) - HTML is never held for every file
+            # Filenames carry the row ID so several events at one park do not overwrite each other
+            generated_files = [
+                (template_filename(park_name, key, row_id), position, key)
+                for position, (park_name, row_id) in enumerate(zip(park_names, row_ids))
+                for key in selected_templates
+            ]
             
-            # Show first few as preview with better error handling
-            st.subheader("Preview Generated Templates")
+            # Pages whose template and event fields are unchanged are reused across clicks
+            if 'render_cache' not in st.session_state:
+                st.session_state.render_cache = RenderCache()
+            render_cache = st.session_state.render_cache
             
-            preview_count = len(generated_files)
-            for i in range(preview_count):
-                filename, content = generated_files[i]
-                with st.expander(f"Preview: {filename}"):
-                    try:
-                        # Show rendered HTML with better error handling
-                        if content and len(content.strip()) > 0:
-                            st.components.v1.html(content, height=600, scrolling=True)
-                        else:
-                            st.warning("Template appears to be empty")
-                    except Exception as e:
-                        st.error(f"Error displaying preview: {str(e)}")
-                        st.info("Template was generated successfully, but preview failed. You can still download it.")
-                    
-                    # Option to view raw HTML if needed
-                    if st.checkbox(f"Show HTML code for {filename}", key=f"show_code_{i}"):
-                        st.code(content, language="html")
-                    
-                    # Download button for individual file
-                    if content and len(content) > 0:
-                        st.download_button(
-                            label=f"📥 Download {filename}",
-                            data=content,
-                            file_name=filename,
-                            mime="text/html",
-                            key=f"download_{i}"
-                        )
-                    else:
-                        st.warning(f"Template {filename} appears to be empty - cannot download")
+            # Keep the results across reruns so the preview can be paged and filtered; the ZIP is only built on download
+            st.session_state.generated = {
+                "files": generated_files,
+                "records": records,
+                "templates": selected_templates,
+                "workers": workers,
+                "sheet_key": sheet_key,
+            }
+            st.session_state.preview_page = 1
+    
+    if 'generated' in st.session_state:
+        generated = st.session_state.generated
+        generated_files = generated["files"]
+        records = generated["records"]
+        render_cache = st.session_state.render_cache
+        
+        st.success(f"✅ Generated {len(generated_files)} template files!")
+        
+        # Paged preview - a template's HTML is only rendered and sent to the browser once it is opened
+        st.subheader("Preview Generated Templates")
+        
+        col_park_filter, col_template_filter = st.columns(2)
+        
+        with col_park_filter:
+            preview_parks = st.multiselect(
+                "Filter by park:",
+                sorted({records[position].park_name for _, position, _ in generated_files}),
+            )
+        
+        with col_template_filter:
+            preview_templates = st.multiselect(
+                "Filter by template:",
+                list(dict.fromkeys(key for _, _, key in generated_files)),
+                format_func=lambda key: TEMPLATE_LABELS[key],
+            )
+        
+        preview_files = [
+            (i, filename, position, key)
+            for i, (filename, position, key) in enumerate(generated_files)
+            if (not preview_parks or records[position].park_name in preview_parks)
+            and (not preview_templates or key in preview_templates)
+        ]
+        
+        total_pages = max(1, -(-len(preview_files) // PREVIEW_PAGE_SIZE))
+        st.session_state.preview_page = min(st.session_state.get('preview_page', 1), total_pages)
+        preview_page = st.number_input(
+            f"Page (of {total_pages}, {len(preview_files)} files)",
+            min_value=1,
+            max_value=total_pages,
+            key="preview_page",
+        )
+        
+        page_start = (preview_page - 1) * PREVIEW_PAGE_SIZE
+        for i, filename, position, key in preview_files[page_start:page_start + PREVIEW_PAGE_SIZE]:
+            if not st.checkbox(f"👁️ Preview: {filename}", key=f"open_preview_{i}"):
+                continue
             
-            # Bulk download option with improved error handling
-            if len(generated_files) > 1:
-                st.subheader("Download All Templates")
-                
-                try:
-                    # Create a zip file with all templates
-                    zip_buffer = io.BytesIO()
-                    
-                    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                        for filename, content in generated_files:
-                            # Ensure content is not None and is properly encoded
-                            if content is not None and len(content.strip()) > 0:
-                                # Convert to bytes if it's a string
-                                if isinstance(content, str):
-                                    content_bytes = content.encode('utf-8')
-                                else:
-                                    content_bytes = content
-                                zip_file.writestr(filename, content_bytes)
-                    
-                    zip_buffer.seek(0)
-                    
-                    st.download_button(
-                        label="📦 Download All Templates as ZIP",
-                        data=zip_buffer.getvalue(),
-                        file_name=f"yspd_email_templates_{datetime.now().strftime('%Y%m%d')}.zip",
-                        mime="application/zip"
-                    )
-                except Exception as e:
-                    st.error(f"Error creating ZIP file: {str(e)}")
-                    st.info("You can still download individual files using the buttons above.")
+            # Render just this one template for its preview
+            content = render_cache.render(key, records[position])
+            
+            try:
+                # Show rendered HTML with better error handling
+                if content and len(content.strip()) > 0:
+                    st.components.v1.html(content, height=600, scrolling=True)
+                else:
+                    st.warning("Template appears to be empty")
+            except Exception as e:
+                st.error(f"Error displaying preview: {str(e)}")
+                st.info("Template was generated successfully, but preview failed. You can still download it.")
+            
+            # Option to view raw HTML if needed
+            if st.checkbox(f"Show HTML code for {filename}", key=f"show_code_{i}"):
+                st.code(content, language="html")
+            
+            # Download button for individual file
+            if content and len(content) > 0:
+                st.download_button(
+                    label=f"📥 Download {filename}",
+                    data=content,
+                    file_name=filename,
+                    mime="text/html",
+                    key=f"download_{i}"
+                )
+            else:
+                st.warning(f"Template {filename} appears to be empty - cannot download")
+        
+        # Bulk download option with improved error handling
+        if len(generated_files) > 1:
+            st.subheader("Download All Templates")
+            
+            st.download_button(
+                label="📦 Download All Templates as ZIP",
+                data=partial(templates_zip, generated, render_cache),
+                file_name=f"yspd_email_templates_{datetime.now().strftime('%Y%m%d')}.zip",
+                mime="application/zip"
+            )
+            st.caption("The archive is built when you click download. If it fails, you can still download individual files from their previews above.")
+        
+        st.caption(
+            f"♻️ Render cache: {render_cache.hits} hits, {render_cache.misses} misses, "
+            f"{len(render_cache)} of {render_cache.max_entries} pages cached"
+        )
 
 # Footer
 st.markdown("---")
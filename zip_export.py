@@ -0,0 +1,37 @@
+import tempfile
+import zipfile
+
+# Archives larger than this are spilled from memory to a temporary file on disk
+SPOOL_MAX_BYTES = 32 * 1024 * 1024
+
+
+def write_zip(files, fileobj):
+    """Write (filename, content) pairs into a ZIP archive on fileobj as they arrive.
+
+    Each entry is compressed and written before the next one is pulled from
+    files, so only one template is held in memory at a time. Empty contents are
+    skipped. Returns the number of entries written.
+    """
+    written = 0
+    with zipfile.ZipFile(fileobj, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        for filename, content in files:
+            # Ensure content is not None and is properly encoded
+            if content is None or len(content.strip()) == 0:
+                continue
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            zip_file.writestr(filename, content)
+            written += 1
+    return written
+
+
+def spooled_zip(files, max_size=SPOOL_MAX_BYTES):
+    """Stream files into a ZIP held in a SpooledTemporaryFile, rewound for reading."""
+    spool = tempfile.SpooledTemporaryFile(max_size=max_size)
+    try:
+        write_zip(files, spool)
+    except Exception:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool